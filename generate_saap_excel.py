@@ -8,14 +8,39 @@ v3 changes:
 - Outcome-focused KRs throughout
 - Best of 32-item (old spreadsheet) + 24-item (current app) versions
 - HRDCorp certification, 3 module curriculum, 20 session target from 24-item
+
+Each sheet is split into a layout step (title block, header row, column
+widths, freeze panes) and a fill step (data rows), so watch mode and
+`--sheets` can rebuild or build single sheets.
 """
 
+import argparse
+import contextlib
+import copy
+import hashlib
+import io
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import zipfile
+
 import openpyxl
+from openpyxl.cell import MergedCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.chart import BarChart, LineChart, PieChart, Reference
+from openpyxl.chart.label import DataLabelList
 from openpyxl.utils import get_column_letter
-from datetime import date
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.worksheet.merge import MergedCellRange
+from openpyxl.writer.excel import ExcelWriter
+from datetime import date, datetime, timedelta, timezone
 
-wb = openpyxl.Workbook()
+DEFAULT_OUTPUT = "/Users/khairul/Documents/MyDev/Work/Motionvii/SAAP2026v2/MotionVii_SAAP_2026_v2.xlsx"
 
 # ── Color palette ──────────────────────────────────────────────
 TEAL = "00897B"
@@ -66,51 +91,159 @@ def style_body_cell(cell, font=None, fill=None, align=None, fmt=None):
         cell.number_format = fmt
 
 
+def kr_progress(kr):
+    """KR progress as a percentage rounded to one decimal (0 when target is 0)."""
+    return round((kr["actual"] / kr["target"]) * 100, 1) if kr["target"] else 0
+
+
+def band_fill(row):
+    """Alternating gray band used on even data rows."""
+    return PatternFill(start_color=GRAY_BG, end_color=GRAY_BG, fill_type="solid") if row % 2 == 0 else None
+
+
+def write_title(ws, cell_range, text, size=14, height=30):
+    ws.merge_cells(cell_range)
+    ws["A1"].value = text
+    ws["A1"].font = Font(name="Aptos", bold=True, color=TEAL, size=size)
+    ws["A1"].alignment = Alignment(horizontal="left", vertical="center")
+    ws.row_dimensions[1].height = height
+
+
+def write_headers(ws, row, headers):
+    for col, h in enumerate(headers, 1):
+        ws.cell(row=row, column=col, value=h)
+    style_header_row(ws, row, len(headers))
+
+
+def set_widths(ws, widths):
+    for col, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+
+# ── Row layout: merges and outline groups ─────────────────────
+# Fill functions record the merges and outline row groups they need in a
+# RowLayout while writing rows, then apply it in one batch. Merged ranges go
+# straight into the sheet's range set: ws.merge_cells() checks each new range
+# against every existing one, which turns quadratic with thousands of
+# groups. Formatting a merge (placeholder cells, edge borders) hashes styles
+# per cell, so it is done once per distinct shape and start-cell style and
+# the resulting cell styles are copied to every other merge. "group" mode
+# replaces the objective merges with collapsible outline levels
+# (objective → KR → initiative) for large datasets.
+LAYOUT_MODES = ("auto", "merge", "group")
+AUTO_GROUP_THRESHOLD = 50  # objectives above which "auto" switches to grouping
+
+
+def resolve_layout_mode(mode, data):
+    if mode == "auto":
+        return "group" if len(data["objectives"]) > AUTO_GROUP_THRESHOLD else "merge"
+    return mode
+
+
+class RowLayout:
+    """Planned merges and row outline levels for one sheet."""
+
+    def __init__(self):
+        self.merges = []  # (min_row, min_col, max_row, max_col, top-left alignment)
+        self.levels = {}  # row → outline level
+
+    def merge(self, min_row, min_col, max_row, max_col, alignment=None):
+        self.merges.append((min_row, min_col, max_row, max_col, alignment))
+
+    def group(self, first_row, last_row, level):
+        for r in range(first_row, last_row + 1):
+            self.levels[r] = max(self.levels.get(r, 0), level)
+
+    def apply(self, ws):
+        # Uses openpyxl internals (ws._clean_merge_range, ws._cells and
+        # cell._style), verified against openpyxl 3.1.5.
+        ranges = ws.merged_cells.ranges
+        formatted = {}  # (start style, height, width) → cell styles in range order
+        for min_row, min_col, max_row, max_col, alignment in self.merges:
+            mcr = MergedCellRange(ws, CellRange(min_col=min_col, min_row=min_row,
+                                                max_col=max_col, max_row=max_row).coord)
+            ranges.add(mcr)
+            coords = list(mcr.cells)
+            key = (tuple(mcr.start_cell._style), max_row - min_row, max_col - min_col)
+            if key not in formatted:
+                # Same placeholder-cell and edge-border handling as merge_cells()
+                ws._clean_merge_range(mcr)
+                formatted[key] = [copy.copy(ws._cells[coord]._style) for coord in coords]
+            else:
+                for (row, col), style in zip(coords[1:], formatted[key][1:]):
+                    cell = ws._cells[row, col] = MergedCell(ws, row=row, column=col)
+                    cell._style = copy.copy(style)
+                mcr.start_cell._style = copy.copy(formatted[key][0])
+            if alignment:
+                ws.cell(row=min_row, column=min_col).alignment = alignment
+        if self.levels:
+            # Each group collapses into the visible row above it
+            ws.sheet_properties.outlinePr.summaryBelow = False
+            for r, level in self.levels.items():
+                ws.row_dimensions[r].outlineLevel = level
+            ws.sheet_format.outlineLevelRow = max(self.levels.values())
+
+
+# ── Number formats: locale and currency ───────────────────────
+# Amounts in the data are ringgit. resolve_formats() turns a locale and
+# display currency into number-format strings once per build; fills look
+# them up by role ("money", "date", "percent") and keep values numeric, so
+# Excel applies the reader's own digit grouping and decimal separator. The
+# LCID prefix pins month names (Malay: Mac, Mei, Ogo, Dis).
+LOCALES = {
+    "en-MY": "DD MMM YYYY",
+    "ms-MY": "[$-43E]DD MMM YYYY",
+    "en-US": "[$-409]MMM DD, YYYY",
+}
+CURRENCIES = {
+    # code: (label in headers and unit cells, number format)
+    "RM": ("RM", "#,##0"),
+    "MYR": ("MYR", '"MYR "#,##0'),
+    "USD": ("USD", '"US$"#,##0'),
+}
+BASE_CURRENCIES = ("RM", "MYR")  # no conversion needed
+
+
+def resolve_formats(locale="en-MY", currency="RM", fx_rate=None):
+    """Number formats and currency conversion for one build.
+
+    `fx_rate` is ringgit per unit of `currency`; it is required for any
+    currency other than RM/MYR.
+    """
+    if currency not in BASE_CURRENCIES and not fx_rate:
+        raise ValueError(f"{currency} output needs an exchange rate (RM per {currency})")
+    label, money_fmt = CURRENCIES[currency]
+    return {
+        "date": LOCALES[locale],
+        "money": money_fmt,
+        "percent": "0.0%",
+        "currency": label,
+        "fx_rate": 1 if currency in BASE_CURRENCIES else fx_rate,
+    }
+
+
+def to_currency(amount, formats):
+    """Convert a ringgit amount into the display currency."""
+    if formats["fx_rate"] == 1 or not isinstance(amount, (int, float)):
+        return amount
+    return round(amount / formats["fx_rate"], 2)
+
+
+# Back-reference columns appended to Sheets 1 and 2 (filled by link_kr_refs)
+BACKREF_HEADERS = ["Initiatives", "Support Tasks"]
+BACKREF_WIDTH = 13
+
+
 # ═══════════════════════════════════════════════════════════════
-# SHEET 1: OKR SUMMARY
+# DATA
 # ═══════════════════════════════════════════════════════════════
-ws1 = wb.active
-ws1.title = "OKR Summary"
-
-# Title block
-ws1.merge_cells("A1:K1")
-ws1["A1"].value = "MotionVii SAAP 2026 — OKR Summary"
-ws1["A1"].font = Font(name="Aptos", bold=True, color=TEAL, size=16)
-ws1["A1"].alignment = Alignment(horizontal="left", vertical="center")
-ws1.row_dimensions[1].height = 35
-
-ws1.merge_cells("A2:K2")
-ws1["A2"].value = "Strategic Annual Action Plan — Scale Events Business & Launch AI Training Revenue Stream"
-ws1["A2"].font = Font(name="Aptos", color="78909C", size=11)
-ws1["A2"].alignment = Alignment(horizontal="left")
-
-# Revenue target row
-ws1.merge_cells("A3:B3")
-ws1["A3"].value = "Revenue Target:"
-ws1["A3"].font = Font(name="Aptos", bold=True, color=DARK, size=11)
-ws1["C3"].value = "RM1,000,000"
-ws1["C3"].font = Font(name="Aptos", bold=True, color=TEAL, size=11)
-ws1.merge_cells("D3:F3")
-ws1["D3"].value = "Events: RM800,000 (80%)  |  AI Training: RM200,000 (20%)"
-ws1["D3"].font = Font(name="Aptos", color=DARK, size=10)
-ws1.row_dimensions[3].height = 22
-
-# Headers
-headers1 = [
-    "Obj #", "Objective", "KR #", "Key Result",
-    "Target", "Actual", "Unit", "Deadline",
-    "Progress %", "Status", "Owner"
-]
-row = 5
-for col, h in enumerate(headers1, 1):
-    ws1.cell(row=row, column=col, value=h)
-style_header_row(ws1, row, len(headers1))
 
 # ── OKR Data ──────────────────────────────────────────────────
 objectives = [
     {
         "num": 1,
         "name": "Scale Events Business",
+        "stream": "Events",
         "krs": [
             {
                 "id": "KR1.1",
@@ -135,6 +268,7 @@ objectives = [
     {
         "num": 2,
         "name": "Build AI Training Business",
+        "stream": "AI Training",
         "krs": [
             {
                 "id": "KR2.1",
@@ -158,95 +292,7 @@ objectives = [
     },
 ]
 
-row = 6
-for obj in objectives:
-    first_kr_row = row
-    for i, kr in enumerate(obj["krs"]):
-        progress = round((kr["actual"] / kr["target"]) * 100, 1) if kr["target"] else 0
-
-        c_obj_num = ws1.cell(row=row, column=1, value=obj["num"])
-        c_obj_name = ws1.cell(row=row, column=2, value=obj["name"])
-        c_kr_id = ws1.cell(row=row, column=3, value=kr["id"])
-        c_kr_desc = ws1.cell(row=row, column=4, value=kr["desc"])
-        if kr["unit"] == "RM":
-            c_target = ws1.cell(row=row, column=5, value=kr["target"])
-            c_target.number_format = '#,##0'
-            c_actual = ws1.cell(row=row, column=6, value=kr["actual"])
-            c_actual.number_format = '#,##0'
-        else:
-            c_target = ws1.cell(row=row, column=5, value=kr["target"])
-            c_actual = ws1.cell(row=row, column=6, value=kr["actual"])
-        c_unit = ws1.cell(row=row, column=7, value=kr["unit"])
-        c_deadline = ws1.cell(row=row, column=8, value=kr["deadline"])
-        c_progress = ws1.cell(row=row, column=9, value=f"{progress}%")
-        c_status = ws1.cell(row=row, column=10, value=kr["status"])
-        c_owner = ws1.cell(row=row, column=11, value=kr["owner"])
-
-        row_fill = PatternFill(start_color=GRAY_BG, end_color=GRAY_BG, fill_type="solid") if row % 2 == 0 else None
-        for c in [c_obj_num, c_obj_name, c_kr_id, c_kr_desc, c_target, c_actual,
-                   c_unit, c_deadline, c_progress, c_status, c_owner]:
-            style_body_cell(c, fill=row_fill)
-        style_body_cell(c_obj_name, font=bold_font, fill=row_fill)
-        style_body_cell(c_obj_num, font=bold_font, fill=row_fill, align=center_align)
-        style_body_cell(c_kr_id, font=bold_font, fill=row_fill, align=center_align)
-        for c in [c_target, c_actual, c_unit, c_deadline, c_progress, c_status, c_owner]:
-            c.alignment = center_align
-
-        # Status color
-        status_colors = {
-            "On Track": (GREEN_LIGHT, GREEN),
-            "At Risk": (AMBER_LIGHT, AMBER),
-            "Behind": (RED_LIGHT, RED),
-        }
-        if kr["status"] in status_colors:
-            bg, fg = status_colors[kr["status"]]
-            c_status.fill = PatternFill(start_color=bg, end_color=bg, fill_type="solid")
-            c_status.font = Font(name="Aptos", color=fg, size=10, bold=True)
-
-        row += 1
-
-    if len(obj["krs"]) > 1:
-        ws1.merge_cells(start_row=first_kr_row, start_column=1, end_row=row - 1, end_column=1)
-        ws1.merge_cells(start_row=first_kr_row, start_column=2, end_row=row - 1, end_column=2)
-        ws1.cell(row=first_kr_row, column=1).alignment = Alignment(horizontal="center", vertical="center")
-        ws1.cell(row=first_kr_row, column=2).alignment = Alignment(vertical="center", wrap_text=True)
-
-ws1.column_dimensions["A"].width = 7
-ws1.column_dimensions["B"].width = 28
-ws1.column_dimensions["C"].width = 8
-ws1.column_dimensions["D"].width = 58
-ws1.column_dimensions["E"].width = 12
-ws1.column_dimensions["F"].width = 10
-ws1.column_dimensions["G"].width = 20
-ws1.column_dimensions["H"].width = 12
-ws1.column_dimensions["I"].width = 12
-ws1.column_dimensions["J"].width = 14
-ws1.column_dimensions["K"].width = 12
-ws1.freeze_panes = "A6"
-
-
-# ═══════════════════════════════════════════════════════════════
-# SHEET 2: KEY RESULTS (detailed tracking)
-# ═══════════════════════════════════════════════════════════════
-ws2 = wb.create_sheet("Key Results")
-
-ws2.merge_cells("A1:M1")
-ws2["A1"].value = "Key Results — Detailed Tracking"
-ws2["A1"].font = Font(name="Aptos", bold=True, color=TEAL, size=14)
-ws2["A1"].alignment = Alignment(horizontal="left", vertical="center")
-ws2.row_dimensions[1].height = 30
-
-headers2 = [
-    "KR ID", "Objective", "Key Result Description",
-    "Metric Type", "Target", "Actual", "Unit", "Progress %",
-    "Deadline", "Status", "Owner",
-    "How We Measure", "Notes"
-]
-r = 3
-for col, h in enumerate(headers2, 1):
-    ws2.cell(row=r, column=col, value=h)
-style_header_row(ws2, r, len(headers2))
-
+# ── KR details (Sheet 2) ──────────────────────────────────────
 kr_details = [
     # ── Obj 1: Scale Events (80% / RM800K) ────────────────────
     ["KR1.1", "Scale Events", "Win 6 event contracts generating RM800K+ combined revenue by Q4 2026",
@@ -281,58 +327,7 @@ kr_details = [
      "Repeat/referral = proof of quality. More sustainable than cold acquisition. NPS tracking feeds into this."],
 ]
 
-r = 4
-for kr_row in kr_details:
-    for col, val in enumerate(kr_row, 1):
-        cell = ws2.cell(row=r, column=col, value=val)
-        row_fill = PatternFill(start_color=GRAY_BG, end_color=GRAY_BG, fill_type="solid") if r % 2 == 0 else None
-        style_body_cell(cell, fill=row_fill)
-        if col in (1, 4, 5, 6, 7, 8, 9, 10, 11):
-            cell.alignment = center_align
-        if col == 1:
-            cell.font = bold_font
-        if col == 5 and isinstance(val, (int, float)) and val >= 1000:
-            cell.number_format = '#,##0'
-    r += 1
-
-ws2.column_dimensions["A"].width = 8
-ws2.column_dimensions["B"].width = 16
-ws2.column_dimensions["C"].width = 55
-ws2.column_dimensions["D"].width = 14
-ws2.column_dimensions["E"].width = 12
-ws2.column_dimensions["F"].width = 10
-ws2.column_dimensions["G"].width = 20
-ws2.column_dimensions["H"].width = 12
-ws2.column_dimensions["I"].width = 12
-ws2.column_dimensions["J"].width = 14
-ws2.column_dimensions["K"].width = 12
-ws2.column_dimensions["L"].width = 60
-ws2.column_dimensions["M"].width = 55
-ws2.freeze_panes = "A4"
-
-
-# ═══════════════════════════════════════════════════════════════
-# SHEET 3: INITIATIVES
-# ═══════════════════════════════════════════════════════════════
-ws3 = wb.create_sheet("Initiatives")
-
-ws3.merge_cells("A1:N1")
-ws3["A1"].value = "Initiatives — Action Items"
-ws3["A1"].font = Font(name="Aptos", bold=True, color=TEAL, size=14)
-ws3["A1"].alignment = Alignment(horizontal="left", vertical="center")
-ws3.row_dimensions[1].height = 30
-
-headers3 = [
-    "ID", "KR", "Objective", "Initiative",
-    "Department", "Start Date", "End Date",
-    "Budget (RM)", "Resources", "Person In Charge", "Accountable",
-    "Status", "Progress", "Remarks"
-]
-r = 3
-for col, h in enumerate(headers3, 1):
-    ws3.cell(row=r, column=col, value=h)
-style_header_row(ws3, r, len(headers3))
-
+# ── Initiatives (Sheet 3) ─────────────────────────────────────
 initiatives = [
     # ══════════════════════════════════════════════════════════
     # OBJECTIVE 1: SCALE EVENTS BUSINESS (80% / RM800K)
@@ -563,58 +558,145 @@ initiatives = [
      None, None, "Azlan", "Khairul", "Pending", "", ""],
 ]
 
-r = 4
-for init in initiatives:
-    for col, val in enumerate(init, 1):
-        cell = ws3.cell(row=r, column=col, value=val)
-        row_fill = PatternFill(start_color=GRAY_BG, end_color=GRAY_BG, fill_type="solid") if r % 2 == 0 else None
-        style_body_cell(cell, fill=row_fill)
-
-        if col == 1:
-            cell.alignment = center_align
-            cell.font = bold_font
-        elif col == 2:
-            cell.alignment = center_align
-            cell.font = bold_font
-        elif col in (5, 10, 11, 12, 13):
-            cell.alignment = center_align
-        elif col == 8:
-            if val:
-                cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal="right", vertical="top")
-        elif col in (6, 7):
-            if val:
-                cell.number_format = 'DD MMM YYYY'
-            cell.alignment = center_align
-    r += 1
-
-ws3.column_dimensions["A"].width = 5
-ws3.column_dimensions["B"].width = 8
-ws3.column_dimensions["C"].width = 16
-ws3.column_dimensions["D"].width = 62
-ws3.column_dimensions["E"].width = 14
-ws3.column_dimensions["F"].width = 14
-ws3.column_dimensions["G"].width = 14
-ws3.column_dimensions["H"].width = 13
-ws3.column_dimensions["I"].width = 22
-ws3.column_dimensions["J"].width = 16
-ws3.column_dimensions["K"].width = 14
-ws3.column_dimensions["L"].width = 12
-ws3.column_dimensions["M"].width = 10
-ws3.column_dimensions["N"].width = 55
-ws3.freeze_panes = "A4"
+# ── Support tasks (Sheet 5) ───────────────────────────────────
+# Category colors
+CAT_DESIGN = PatternFill(start_color="E8EAF6", end_color="E8EAF6", fill_type="solid")  # Indigo light
+CAT_BIZ = PatternFill(start_color="E0F2F1", end_color="E0F2F1", fill_type="solid")     # Teal light
+CAT_TALENTA = PatternFill(start_color="FFF3E0", end_color="FFF3E0", fill_type="solid")  # Orange light
+CAT_OPS = PatternFill(start_color="F3E5F5", end_color="F3E5F5", fill_type="solid")      # Purple light
+
+support_tasks = [
+    # ── DESIGN & CREATIVE (Azlan) ─────────────────────────────
+    # category_fill, id, category, task, supports, owner, frequency, priority, notes
 
+    (CAT_DESIGN, 1, "Design & Creative", "Design event proposal decks and pitch materials",
+     "KR1.1", "Azlan", "Per proposal", "High",
+     "Each of the 7 proposals needs a tailored deck. Template-first approach to save time."),
 
-# ═══════════════════════════════════════════════════════════════
-# SHEET 4: STRUCTURE GUIDE
-# ═══════════════════════════════════════════════════════════════
-ws4 = wb.create_sheet("Structure Guide")
+    (CAT_DESIGN, 2, "Design & Creative", "Design event collateral (banners, backdrops, signage, badges)",
+     "KR1.1", "Azlan", "Per event won", "High",
+     "Triggered after contract signed. Budget included in event project cost."),
+
+    (CAT_DESIGN, 3, "Design & Creative", "Video production and editing for event content",
+     "KR1.1, KR1.3", "Azlan", "Per event", "High",
+     "Event recap videos, highlight reels. Also feeds case studies for KR1.3."),
+
+    (CAT_DESIGN, 4, "Design & Creative", "Design event case study layouts",
+     "KR1.3", "Azlan", "2x per year", "Medium",
+     "Supports initiative #15 — need min 2 case studies for marketing."),
+
+    (CAT_DESIGN, 5, "Design & Creative", "Design international marketing pack (portfolio, showreel)",
+     "KR1.2", "Azlan", "Once + updates", "High",
+     "Supports initiative #14. Showcase Petronas/O&G work for partnerships and intl prospects."),
+
+    (CAT_DESIGN, 6, "Design & Creative", "Update MotionVii website content and visuals",
+     "KR1.2, KR2.2", "Azlan", "Monthly", "Medium",
+     "Keep portfolio current. Add AI training section after commercial launch."),
+
+    (CAT_DESIGN, 7, "Design & Creative", "Social media content creation (posts, reels, stories)",
+     "KR1.2, KR2.2", "Azlan", "Weekly", "Medium",
+     "Maintain brand visibility across both events and AI training."),
+
+    (CAT_DESIGN, 8, "Design & Creative", "Design AI training presentation slides and handout materials",
+     "KR2.1", "Azlan", "Per module", "High",
+     "Supports Module 1/2/3 development. Professional materials = premium pricing justified."),
 
-ws4.merge_cells("A1:F1")
-ws4["A1"].value = "OKR Structure Guide"
-ws4["A1"].font = Font(name="Aptos", bold=True, color=TEAL, size=14)
-ws4.row_dimensions[1].height = 30
+    (CAT_DESIGN, 9, "Design & Creative", "Design AI training brochure and marketing collateral",
+     "KR2.2", "Azlan", "Once + updates", "High",
+     "Supports initiative #29. Needs to be ready before commercial launch."),
 
+    (CAT_DESIGN, 10, "Design & Creative", "Video testimonials from training participants",
+     "KR2.3", "Azlan", "After each session", "Medium",
+     "Quick video testimonials boost referral credibility. Get permission during session."),
+
+    (CAT_DESIGN, 11, "Design & Creative", "Portfolio and showreel updates (quarterly refresh)",
+     "KR1.1, KR1.2", "Azlan", "Quarterly", "Medium",
+     "Keep demo reel current with latest event and video work."),
+
+    # ── BUSINESS & ADMIN (Khairul) ────────────────────────────
+
+    (CAT_BIZ, 12, "Business & Admin", "Proposal writing and quotation preparation",
+     "KR1.1", "Khairul", "Per opportunity", "High",
+     "Each proposal needs custom scope, pricing, timeline. Use templates to speed up."),
+
+    (CAT_BIZ, 13, "Business & Admin", "Contract preparation, review, and execution",
+     "KR1.1, KR2.2", "Khairul", "Per deal", "High",
+     "Both event contracts and AI training contracts."),
+
+    (CAT_BIZ, 14, "Business & Admin", "Invoicing and payment follow-up",
+     "KR1.1, KR2.2", "Khairul", "Per project/session", "High",
+     "Revenue only counts when invoiced. Track in SAAP project financials."),
+
+    (CAT_BIZ, 15, "Business & Admin", "Financial reporting and budget tracking (SAAP)",
+     "All KRs", "Khairul", "Monthly", "High",
+     "Monthly review of revenue vs RM1M target. Events vs Training split."),
+
+    (CAT_BIZ, 16, "Business & Admin", "Client relationship management and meeting notes",
+     "KR1.1, KR1.3", "Khairul", "Ongoing", "Medium",
+     "CRM updates after every client interaction. Feed data to KR tracking."),
+
+    (CAT_BIZ, 17, "Business & Admin", "Supplier and vendor management (logistics, venues, AV)",
+     "KR1.1, KR1.2", "Khairul", "Per event", "Medium",
+     "Negotiate rates, manage relationships, ensure delivery quality."),
+
+    (CAT_BIZ, 18, "Business & Admin", "HR — freelancer/contractor onboarding and management",
+     "KR1.2", "Khairul", "As needed", "Medium",
+     "Event PIC managers, marketing contractors. Supports initiative #12."),
+
+    (CAT_BIZ, 19, "Business & Admin", "HRDCorp application documentation and follow-up",
+     "KR2.2", "Khairul", "Until approved", "High",
+     "Supports initiative #26. Documentation-heavy process — track milestones."),
+
+    (CAT_BIZ, 20, "Business & Admin", "AI training session logistics (venue, equipment, catering)",
+     "KR2.1", "Khairul", "Per session", "Medium",
+     "Book venue, arrange equipment, handle logistics for each corporate session."),
+
+    (CAT_BIZ, 21, "Business & Admin", "Partnership agreement drafting and negotiation",
+     "KR1.2", "Khairul", "Per partnership", "Medium",
+     "MOU or formal partnership agreement. Legal review if needed."),
+
+    (CAT_BIZ, 22, "Business & Admin", "International compliance and logistics (travel, permits, banking)",
+     "KR1.1", "Khairul", "Per intl engagement", "Low",
+     "Only triggered when international work materializes. Cross-border invoicing, travel planning."),
+
+    # ── TALENTA IDEAS REQUESTS ────────────────────────────────
+
+    (CAT_TALENTA, 23, "Talenta Ideas", "Design requests from Talenta Ideas (ad-hoc)",
+     "Parent company", "Azlan", "Ad-hoc", "Medium",
+     "As subsidiary, MotionVii supports Talenta's design needs. Track hours to manage capacity."),
+
+    (CAT_TALENTA, 24, "Talenta Ideas", "Video production requests from Talenta Ideas",
+     "Parent company", "Azlan", "Ad-hoc", "Medium",
+     "Corporate videos, internal comms, event coverage for Talenta's own projects."),
+
+    (CAT_TALENTA, 25, "Talenta Ideas", "Talenta Ideas brand and marketing material updates",
+     "Parent company", "Azlan", "Quarterly", "Low",
+     "Brochure updates, presentation templates, brand guideline maintenance."),
+
+    (CAT_TALENTA, 26, "Talenta Ideas", "Coordination and reporting to Talenta Ideas management",
+     "Parent company", "Khairul", "Monthly", "Medium",
+     "Monthly update on MotionVii performance, revenue, and SAAP progress to parent company."),
+
+    # ── OPERATIONS & INFRASTRUCTURE ───────────────────────────
+
+    (CAT_OPS, 27, "Operations", "SAAP platform maintenance and development",
+     "All KRs", "Khairul", "Ongoing", "Medium",
+     "The tool tracking all of this. Bug fixes, new features, data integrity."),
+
+    (CAT_OPS, 28, "Operations", "Software subscriptions and tool management",
+     "All KRs", "Khairul", "Monthly", "Low",
+     "CRM, automation tools, design software, project management. Renewals and cost control."),
+
+    (CAT_OPS, 29, "Operations", "Document management and filing (contracts, proposals, invoices)",
+     "All KRs", "Khairul", "Ongoing", "Low",
+     "Keep organized for audits, HRDCorp requirements, and client records."),
+
+    (CAT_OPS, 30, "Operations", "Team capacity planning and workload balancing",
+     "All KRs", "Khairul", "Bi-weekly", "High",
+     "3-person team running 37 initiatives + support tasks + Talenta requests. Watch for bottlenecks on Azlan (design) and Khairul (business)."),
+]
+
+# ── Structure guide (Sheet 4, static) ─────────────────────────
 guide_content = [
     ["", "", "", "", "", ""],
     ["Layer", "What It Is", "Example", "Tracking", "Review Cadence", "Who Owns It"],
@@ -730,241 +812,1531 @@ guide_content = [
     ],
 ]
 
-for ridx, row_data in enumerate(guide_content, 2):
-    for c, val in enumerate(row_data, 1):
-        cell = ws4.cell(row=ridx, column=c, value=val)
-        cell.font = body_font
-        cell.alignment = wrap_align
-        cell.border = thin_border
+CATEGORY_FILLS = {
+    "Design & Creative": CAT_DESIGN,
+    "Business & Admin": CAT_BIZ,
+    "Talenta Ideas": CAT_TALENTA,
+    "Operations": CAT_OPS,
+}
 
-        # Header rows (Layer/Revenue/Changes/Anti-pattern tables)
-        if ridx in (3, 9, 15, 23):
-            cell.font = header_font
-            cell.fill = header_fill
-        # Section title rows
-        elif ridx in (8, 14, 22):
-            cell.font = Font(name="Aptos", bold=True, color=TEAL, size=11)
-            cell.border = Border()
-        # "Total" row bold
-        elif ridx == 12:
-            cell.font = bold_font
-
-ws4.column_dimensions["A"].width = 24
-ws4.column_dimensions["B"].width = 30
-ws4.column_dimensions["C"].width = 30
-ws4.column_dimensions["D"].width = 38
-ws4.column_dimensions["E"].width = 14
-ws4.column_dimensions["F"].width = 14
+SAAP_DATA = {
+    "objectives": objectives,
+    "kr_details": kr_details,
+    "initiatives": initiatives,
+    "support_tasks": support_tasks,
+}
 
 
 # ═══════════════════════════════════════════════════════════════
-# SHEET 5: SUPPORT TASKS
+# SHEET 1: OKR SUMMARY
+# ═══════════════════════════════════════════════════════════════
+headers1 = [
+    "Obj #", "Objective", "KR #", "Key Result",
+    "Target", "Actual", "Unit", "Deadline",
+    "Progress %", "Status", "Owner"
+]
+HEADER_ROW1 = 5
+
+
+def layout_okr_summary(ws):
+    # Title block
+    write_title(ws, "A1:M1", "MotionVii SAAP 2026 — OKR Summary", size=16, height=35)
+
+    ws.merge_cells("A2:M2")
+    ws["A2"].value = "Strategic Annual Action Plan — Scale Events Business & Launch AI Training Revenue Stream"
+    ws["A2"].font = Font(name="Aptos", color="78909C", size=11)
+    ws["A2"].alignment = Alignment(horizontal="left")
+
+    # Revenue target row
+    ws.merge_cells("A3:B3")
+    ws["A3"].value = "Revenue Target:"
+    ws["A3"].font = Font(name="Aptos", bold=True, color=DARK, size=11)
+    ws["C3"].value = "RM1,000,000"
+    ws["C3"].font = Font(name="Aptos", bold=True, color=TEAL, size=11)
+    ws.merge_cells("D3:F3")
+    ws["D3"].value = "Events: RM800,000 (80%)  |  AI Training: RM200,000 (20%)"
+    ws["D3"].font = Font(name="Aptos", color=DARK, size=10)
+    ws.row_dimensions[3].height = 22
+
+    write_headers(ws, HEADER_ROW1, headers1 + BACKREF_HEADERS)
+    set_widths(ws, [7, 28, 8, 58, 12, 10, 20, 12, 12, 14, 12] + [BACKREF_WIDTH] * 2)
+    ws.freeze_panes = "A6"
+
+
+def fill_okr_summary(ws, data, ctx):
+    """Write KR rows grouped by objective, then the back-reference counts."""
+    objectives = data["objectives"]
+    formats = ctx["formats"]
+    kr_rows = {}
+    row_layout = RowLayout()
+    row = HEADER_ROW1 + 1
+    for obj in objectives:
+        first_kr_row = row
+        for i, kr in enumerate(obj["krs"]):
+            kr_rows[kr["id"]] = row
+            progress = kr_progress(kr)
+
+            c_obj_num = ws.cell(row=row, column=1, value=obj["num"])
+            c_obj_name = ws.cell(row=row, column=2, value=obj["name"])
+            c_kr_id = ws.cell(row=row, column=3, value=kr["id"])
+            c_kr_desc = ws.cell(row=row, column=4, value=kr["desc"])
+            if kr["unit"] == "RM":
+                c_target = ws.cell(row=row, column=5, value=to_currency(kr["target"], formats))
+                c_target.number_format = formats["money"]
+                c_actual = ws.cell(row=row, column=6, value=to_currency(kr["actual"], formats))
+                c_actual.number_format = formats["money"]
+                c_unit = ws.cell(row=row, column=7, value=formats["currency"])
+            else:
+                c_target = ws.cell(row=row, column=5, value=kr["target"])
+                c_actual = ws.cell(row=row, column=6, value=kr["actual"])
+                c_unit = ws.cell(row=row, column=7, value=kr["unit"])
+            c_deadline = ws.cell(row=row, column=8, value=kr["deadline"])
+            c_progress = ws.cell(row=row, column=9, value=progress / 100)
+            c_progress.number_format = formats["percent"]
+            c_status = ws.cell(row=row, column=10, value=kr["status"])
+            c_owner = ws.cell(row=row, column=11, value=kr["owner"])
+
+            row_fill = band_fill(row)
+            for c in [c_obj_num, c_obj_name, c_kr_id, c_kr_desc, c_target, c_actual,
+                       c_unit, c_deadline, c_progress, c_status, c_owner]:
+                style_body_cell(c, fill=row_fill)
+            style_body_cell(c_obj_name, font=bold_font, fill=row_fill)
+            style_body_cell(c_obj_num, font=bold_font, fill=row_fill, align=center_align)
+            style_body_cell(c_kr_id, font=bold_font, fill=row_fill, align=center_align)
+            for c in [c_target, c_actual, c_unit, c_deadline, c_progress, c_status, c_owner]:
+                c.alignment = center_align
+
+            # Status color
+            status_colors = {
+                "On Track": (GREEN_LIGHT, GREEN),
+                "At Risk": (AMBER_LIGHT, AMBER),
+                "Behind": (RED_LIGHT, RED),
+            }
+            if kr["status"] in status_colors:
+                bg, fg = status_colors[kr["status"]]
+                c_status.fill = PatternFill(start_color=bg, end_color=bg, fill_type="solid")
+                c_status.font = Font(name="Aptos", color=fg, size=10, bold=True)
+
+            row += 1
+
+        if len(obj["krs"]) > 1:
+            if ctx["layout_mode"] == "group":
+                row_layout.group(first_kr_row + 1, row - 1, 1)
+            else:
+                row_layout.merge(first_kr_row, 1, row - 1, 1,
+                                 Alignment(horizontal="center", vertical="center"))
+                row_layout.merge(first_kr_row, 2, row - 1, 2,
+                                 Alignment(vertical="center", wrap_text=True))
+    row_layout.apply(ws)
+    write_backrefs(ws, len(headers1) + 1, kr_rows, ctx["links"])
+
+
+# ═══════════════════════════════════════════════════════════════
+# SHEET 2: KEY RESULTS (detailed tracking)
+# ═══════════════════════════════════════════════════════════════
+headers2 = [
+    "KR ID", "Objective", "Key Result Description",
+    "Metric Type", "Target", "Actual", "Unit", "Progress %",
+    "Deadline", "Status", "Owner",
+    "How We Measure", "Notes"
+]
+HEADER_ROW2 = 3
+
+
+def layout_key_results(ws):
+    write_title(ws, "A1:O1", "Key Results — Detailed Tracking")
+    write_headers(ws, HEADER_ROW2, headers2 + BACKREF_HEADERS)
+    set_widths(ws, [8, 16, 55, 14, 12, 10, 20, 12, 12, 14, 12, 60, 55] + [BACKREF_WIDTH] * 2)
+    ws.freeze_panes = "A4"
+
+
+def fill_key_results(ws, data, ctx):
+    """Write one row per KR detail, then the back-reference counts."""
+    formats = ctx["formats"]
+    kr_rows = {}
+    r = HEADER_ROW2 + 1
+    for kr_row in data["kr_details"]:
+        kr_rows[kr_row[0]] = r
+        is_money = kr_row[6] == "RM"
+        for col, val in enumerate(kr_row, 1):
+            if is_money and col in (5, 6):
+                val = to_currency(val, formats)
+            elif is_money and col == 7:
+                val = formats["currency"]
+            elif col == 8:
+                val = kr_progress({"target": kr_row[4], "actual": kr_row[5]}) / 100
+            cell = ws.cell(row=r, column=col, value=val)
+            style_body_cell(cell, fill=band_fill(r))
+            if col in (1, 4, 5, 6, 7, 8, 9, 10, 11):
+                cell.alignment = center_align
+            if col == 1:
+                cell.font = bold_font
+            if is_money and col in (5, 6):
+                cell.number_format = formats["money"]
+            elif col == 8:
+                cell.number_format = formats["percent"]
+        r += 1
+    write_backrefs(ws, len(headers2) + 1, kr_rows, ctx["links"])
+
+
+# ═══════════════════════════════════════════════════════════════
+# SHEET 3: INITIATIVES
 # ═══════════════════════════════════════════════════════════════
-ws5 = wb.create_sheet("Support Tasks")
+headers3 = [
+    "ID", "KR", "Objective", "Initiative",
+    "Department", "Start Date", "End Date",
+    "Budget (RM)", "Resources", "Person In Charge", "Accountable",
+    "Status", "Progress", "Remarks"
+]
+HEADER_ROW3 = 3
+
+
+def layout_initiatives(ws):
+    write_title(ws, "A1:N1", "Initiatives — Action Items")
+    write_headers(ws, HEADER_ROW3, headers3)
+    set_widths(ws, [5, 8, 16, 62, 14, 14, 14, 13, 22, 16, 14, 12, 10, 55])
+    ws.freeze_panes = "A4"
+
+
+def fill_initiatives(ws, data, ctx):
+    formats = ctx["formats"]
+    ws.cell(row=HEADER_ROW3, column=8, value=f"Budget ({formats['currency']})")
+    r = HEADER_ROW3 + 1
+    for init in data["initiatives"]:
+        for col, val in enumerate(init, 1):
+            if col == 8:
+                val = to_currency(val, formats)
+            cell = ws.cell(row=r, column=col, value=val)
+            style_body_cell(cell, fill=band_fill(r))
+
+            if col == 1:
+                cell.alignment = center_align
+                cell.font = bold_font
+            elif col == 2:
+                cell.alignment = center_align
+                cell.font = bold_font
+            elif col in (5, 10, 11, 12, 13):
+                cell.alignment = center_align
+            elif col == 8:
+                if val:
+                    cell.number_format = formats["money"]
+                    cell.alignment = Alignment(horizontal="right", vertical="top")
+            elif col in (6, 7):
+                if val:
+                    cell.number_format = formats["date"]
+                cell.alignment = center_align
+        r += 1
+
+    if ctx["layout_mode"] == "group":
+        # Objective (level 1) → KR (level 2): rows after the first of each
+        # contiguous run fold into that first row.
+        row_layout = RowLayout()
+        first = HEADER_ROW3 + 1
+        prev_obj = prev_kr = None
+        for i, init in enumerate(data["initiatives"]):
+            if init[2] != prev_obj:
+                prev_obj, prev_kr = init[2], init[1]
+                continue
+            row_layout.group(first + i, first + i, 1)
+            if init[1] == prev_kr:
+                row_layout.group(first + i, first + i, 2)
+            prev_kr = init[1]
+        row_layout.apply(ws)
+    mark_dangling(ws, ctx["links"])
 
-ws5.merge_cells("A1:H1")
-ws5["A1"].value = "Support Tasks — Operational Work Supporting SAAP Initiatives"
-ws5["A1"].font = Font(name="Aptos", bold=True, color=TEAL, size=14)
-ws5["A1"].alignment = Alignment(horizontal="left", vertical="center")
-ws5.row_dimensions[1].height = 30
 
-ws5.merge_cells("A2:H2")
-ws5["A2"].value = "These are recurring, ad-hoc, or BAU tasks — not strategic initiatives, but needed to deliver them."
-ws5["A2"].font = Font(name="Aptos", color="78909C", size=10)
-ws5["A2"].alignment = Alignment(horizontal="left")
+# ═══════════════════════════════════════════════════════════════
+# SHEET 4: STRUCTURE GUIDE (static — layout only)
+# ═══════════════════════════════════════════════════════════════
+def layout_structure_guide(ws):
+    ws.merge_cells("A1:F1")
+    ws["A1"].value = "OKR Structure Guide"
+    ws["A1"].font = Font(name="Aptos", bold=True, color=TEAL, size=14)
+    ws.row_dimensions[1].height = 30
+
+    for ridx, row_data in enumerate(guide_content, 2):
+        for c, val in enumerate(row_data, 1):
+            cell = ws.cell(row=ridx, column=c, value=val)
+            cell.font = body_font
+            cell.alignment = wrap_align
+            cell.border = thin_border
+
+            # Header rows (Layer/Revenue/Changes/Anti-pattern tables)
+            if ridx in (3, 9, 15, 23):
+                cell.font = header_font
+                cell.fill = header_fill
+            # Section title rows
+            elif ridx in (8, 14, 22):
+                cell.font = Font(name="Aptos", bold=True, color=TEAL, size=11)
+                cell.border = Border()
+            # "Total" row bold
+            elif ridx == 12:
+                cell.font = bold_font
+
+    set_widths(ws, [24, 30, 30, 38, 14, 14])
 
+
+# ═══════════════════════════════════════════════════════════════
+# SHEET 5: SUPPORT TASKS
+# ═══════════════════════════════════════════════════════════════
 headers5 = [
     "ID", "Category", "Task", "Supports",
     "Owner", "Frequency", "Priority", "Notes"
 ]
-r = 4
-for col, h in enumerate(headers5, 1):
-    ws5.cell(row=r, column=col, value=h)
-style_header_row(ws5, r, len(headers5))
+HEADER_ROW5 = 4
 
-# Category colors
-CAT_DESIGN = PatternFill(start_color="E8EAF6", end_color="E8EAF6", fill_type="solid")  # Indigo light
-CAT_BIZ = PatternFill(start_color="E0F2F1", end_color="E0F2F1", fill_type="solid")     # Teal light
-CAT_TALENTA = PatternFill(start_color="FFF3E0", end_color="FFF3E0", fill_type="solid")  # Orange light
-CAT_OPS = PatternFill(start_color="F3E5F5", end_color="F3E5F5", fill_type="solid")      # Purple light
 
-support_tasks = [
-    # ── DESIGN & CREATIVE (Azlan) ─────────────────────────────
-    # category_fill, id, category, task, supports, owner, frequency, priority, notes
+def layout_support_tasks(ws):
+    write_title(ws, "A1:H1", "Support Tasks — Operational Work Supporting SAAP Initiatives")
 
-    (CAT_DESIGN, 1, "Design & Creative", "Design event proposal decks and pitch materials",
-     "KR1.1", "Azlan", "Per proposal", "High",
-     "Each of the 7 proposals needs a tailored deck. Template-first approach to save time."),
+    ws.merge_cells("A2:H2")
+    ws["A2"].value = "These are recurring, ad-hoc, or BAU tasks — not strategic initiatives, but needed to deliver them."
+    ws["A2"].font = Font(name="Aptos", color="78909C", size=10)
+    ws["A2"].alignment = Alignment(horizontal="left")
 
-    (CAT_DESIGN, 2, "Design & Creative", "Design event collateral (banners, backdrops, signage, badges)",
-     "KR1.1", "Azlan", "Per event won", "High",
-     "Triggered after contract signed. Budget included in event project cost."),
+    write_headers(ws, HEADER_ROW5, headers5)
+    set_widths(ws, [5, 18, 55, 16, 12, 16, 10, 60])
+    ws.freeze_panes = "A5"
 
-    (CAT_DESIGN, 3, "Design & Creative", "Video production and editing for event content",
-     "KR1.1, KR1.3", "Azlan", "Per event", "High",
-     "Event recap videos, highlight reels. Also feeds case studies for KR1.3."),
 
-    (CAT_DESIGN, 4, "Design & Creative", "Design event case study layouts",
-     "KR1.3", "Azlan", "2x per year", "Medium",
-     "Supports initiative #15 — need min 2 case studies for marketing."),
+def fill_support_tasks(ws, data, ctx):
+    r = HEADER_ROW5 + 1
+    for task in data["support_tasks"]:
+        cat_fill = task[0]
+        values = task[1:]  # id, category, task, supports, owner, frequency, priority, notes
 
-    (CAT_DESIGN, 5, "Design & Creative", "Design international marketing pack (portfolio, showreel)",
-     "KR1.2", "Azlan", "Once + updates", "High",
-     "Supports initiative #14. Showcase Petronas/O&G work for partnerships and intl prospects."),
+        for col, val in enumerate(values, 1):
+            cell = ws.cell(row=r, column=col, value=val)
+            style_body_cell(cell)
 
-    (CAT_DESIGN, 6, "Design & Creative", "Update MotionVii website content and visuals",
-     "KR1.2, KR2.2", "Azlan", "Monthly", "Medium",
-     "Keep portfolio current. Add AI training section after commercial launch."),
+            # Apply category color to row
+            cell.fill = cat_fill
 
-    (CAT_DESIGN, 7, "Design & Creative", "Social media content creation (posts, reels, stories)",
-     "KR1.2, KR2.2", "Azlan", "Weekly", "Medium",
-     "Maintain brand visibility across both events and AI training."),
+            if col == 1:  # ID
+                cell.alignment = center_align
+                cell.font = bold_font
+            elif col == 2:  # Category
+                cell.font = bold_font
+            elif col in (4, 5, 6, 7):  # Supports, Owner, Frequency, Priority
+                cell.alignment = center_align
 
-    (CAT_DESIGN, 8, "Design & Creative", "Design AI training presentation slides and handout materials",
-     "KR2.1", "Azlan", "Per module", "High",
-     "Supports Module 1/2/3 development. Professional materials = premium pricing justified."),
+            # Priority color override
+            if col == 7:
+                if val == "High":
+                    cell.font = Font(name="Aptos", color=RED, size=10, bold=True)
+                elif val == "Medium":
+                    cell.font = Font(name="Aptos", color=AMBER, size=10, bold=True)
+                elif val == "Low":
+                    cell.font = Font(name="Aptos", color="78909C", size=10)
+        r += 1
+    mark_dangling(ws, ctx["links"])
 
-    (CAT_DESIGN, 9, "Design & Creative", "Design AI training brochure and marketing collateral",
-     "KR2.2", "Azlan", "Once + updates", "High",
-     "Supports initiative #29. Needs to be ready before commercial launch."),
 
-    (CAT_DESIGN, 10, "Design & Creative", "Video testimonials from training participants",
-     "KR2.3", "Azlan", "After each session", "Medium",
-     "Quick video testimonials boost referral credibility. Get permission during session."),
+# ═══════════════════════════════════════════════════════════════
+# KR LINKS: resolve initiative / support task references
+# ═══════════════════════════════════════════════════════════════
+# Computed once per build, before any sheet is filled. Each reference string
+# is resolved against a KR index (dict), "All KRs" expands to every KR, and
+# anything shaped like a KR ID that isn't in the index is flagged as
+# dangling. Non-KR targets such as "Parent company" are left unlinked.
+ALL_KRS = "All KRs"
+
+
+def resolve_kr_refs(ref, kr_index):
+    """Split a reference string into (linked KR IDs, dangling KR IDs)."""
+    linked, dangling = [], []
+    for token in (ref or "").split(","):
+        token = token.strip()
+        if token == ALL_KRS:
+            linked.extend(kr_index)
+        elif token in kr_index:
+            linked.append(token)
+        elif token.upper().startswith("KR"):
+            dangling.append(token)
+    return linked, dangling
+
+
+def compute_kr_links(data):
+    """Count initiative / support task links per KR and collect dangling refs.
+
+    Dangling refs are (sheet title, row, column, item ID, reference).
+    """
+    kr_index = {kr["id"]: kr for obj in data["objectives"] for kr in obj["krs"]}
+    initiative_links = {kr_id: 0 for kr_id in kr_index}
+    support_links = {kr_id: 0 for kr_id in kr_index}
+    dangling_links = []
+
+    # A sheet selection may load only one of the two referring sections.
+    for i, init in enumerate(data.get("initiatives", ())):
+        linked, dangling = resolve_kr_refs(init[1], kr_index)
+        for kr_id in set(linked):
+            initiative_links[kr_id] += 1
+        for ref in dangling:
+            dangling_links.append(("Initiatives", HEADER_ROW3 + 1 + i, 2, init[0], ref))
+
+    for i, task in enumerate(data.get("support_tasks", ())):
+        linked, dangling = resolve_kr_refs(task[4], kr_index)
+        for kr_id in set(linked):
+            support_links[kr_id] += 1
+        for ref in dangling:
+            dangling_links.append(("Support Tasks", HEADER_ROW5 + 1 + i, 4, task[1], ref))
+
+    return {"initiatives": initiative_links, "support_tasks": support_links, "dangling": dangling_links}
+
+
+def write_backrefs(ws, first_col, kr_rows, links):
+    """Fill the Initiatives / Support Tasks count columns for each KR row."""
+    for kr_id, r in kr_rows.items():
+        for offset, counts in enumerate((links["initiatives"], links["support_tasks"])):
+            cell = ws.cell(row=r, column=first_col + offset, value=counts.get(kr_id, 0))
+            style_body_cell(cell, fill=band_fill(r), align=center_align)
+
+
+def mark_dangling(ws, links):
+    """Highlight this sheet's references to unknown KRs (listed on the Issues sheet)."""
+    dangling_fill = PatternFill(start_color=RED_LIGHT, end_color=RED_LIGHT, fill_type="solid")
+    dangling_font = Font(name="Aptos", color=RED, size=10, bold=True)
+    for title, r, col, _, _ in links["dangling"]:
+        if title != ws.title:
+            continue
+        cell = ws.cell(row=r, column=col)
+        cell.fill = dangling_fill
+        cell.font = dangling_font
 
-    (CAT_DESIGN, 11, "Design & Creative", "Portfolio and showreel updates (quarterly refresh)",
-     "KR1.1, KR1.2", "Azlan", "Quarterly", "Medium",
-     "Keep demo reel current with latest event and video work."),
 
-    # ── BUSINESS & ADMIN (Khairul) ────────────────────────────
+# ═══════════════════════════════════════════════════════════════
+# SHEET 6: DASHBOARD (native charts over rollup tables)
+# ═══════════════════════════════════════════════════════════════
+# Rollups are computed once per run from the data lists; the charts
+# reference the rollup cells, so they redraw in Excel when values change.
+# Revenue rows are labelled by an objective's optional "stream" (its name
+# if unset).
+
+
+def layout_dashboard(ws):
+    write_title(ws, "A1:H1", "Dashboard — Progress & Revenue Rollups")
+    set_widths(ws, [34, 14, 14])
+
+
+def compute_rollups(data):
+    objective_progress = []
+    revenue_rollup = []
+    for obj in data["objectives"]:
+        progresses = [kr_progress(kr) for kr in obj["krs"]]
+        objective_progress.append((
+            f"Obj {obj['num']}: {obj['name']}",
+            round(sum(progresses) / len(progresses), 1) if progresses else 0,
+        ))
+        rm_krs = [kr for kr in obj["krs"] if kr["unit"] == "RM"]
+        if rm_krs:
+            revenue_rollup.append((
+                obj.get("stream", obj["name"]),
+                sum(kr["actual"] for kr in rm_krs),
+                sum(kr["target"] for kr in rm_krs),
+            ))
+
+    status_counts = {}
+    for init in data["initiatives"]:
+        status_counts[init[11]] = status_counts.get(init[11], 0) + 1
+
+    return {
+        "objective_progress": objective_progress,
+        "revenue": revenue_rollup,
+        "status_counts": sorted(status_counts.items()),
+    }
+
+
+def write_rollup_table(ws, top_row, title, headers, rows, fmts):
+    """Write a titled rollup table and return (header_row, last_row)."""
+    ws.cell(row=top_row, column=1, value=title).font = Font(name="Aptos", bold=True, color=TEAL, size=11)
+    header_row = top_row + 1
+    for col, h in enumerate(headers, 1):
+        ws.cell(row=header_row, column=col, value=h)
+    style_header_row(ws, header_row, len(headers))
+    r = header_row + 1
+    for data_row in rows:
+        for col, val in enumerate(data_row, 1):
+            cell = ws.cell(row=r, column=col, value=val)
+            style_body_cell(cell, font=bold_font if col == 1 else None,
+                            align=None if col == 1 else center_align, fmt=fmts[col - 1])
+        r += 1
+    return header_row, r - 1
+
+
+def fill_dashboard(ws, data, ctx):
+    formats = ctx["formats"]
+    rollups = compute_rollups(data)
+    progress = [(name, value / 100) for name, value in rollups["objective_progress"]]
+    revenue = [(stream, to_currency(actual, formats), to_currency(target, formats))
+               for stream, actual, target in rollups["revenue"]]
+    currency = formats["currency"]
+    prog_hdr, prog_last = write_rollup_table(
+        ws, 3, "Objective Progress", ["Objective", "Progress %"],
+        progress, [None, formats["percent"]],
+    )
+    rev_hdr, rev_last = write_rollup_table(
+        ws, prog_last + 2, "Revenue vs Target", ["Stream", f"Actual ({currency})", f"Target ({currency})"],
+        revenue, [None, formats["money"], formats["money"]],
+    )
+    stat_hdr, stat_last = write_rollup_table(
+        ws, rev_last + 2, "Initiative Status", ["Status", "Initiatives"],
+        rollups["status_counts"], [None, '0'],
+    )
+
+    # ── Charts ────────────────────────────────────────────────
+    chart_prog = BarChart()
+    chart_prog.type = "bar"
+    chart_prog.title = "Objective Progress"
+    chart_prog.y_axis.title = "Progress %"
+    chart_prog.y_axis.scaling.min = 0
+    chart_prog.y_axis.scaling.max = 1
+    chart_prog.y_axis.numFmt = formats["percent"]
+    chart_prog.legend = None
+    chart_prog.add_data(Reference(ws, min_col=2, min_row=prog_hdr, max_row=prog_last), titles_from_data=True)
+    chart_prog.set_categories(Reference(ws, min_col=1, min_row=prog_hdr + 1, max_row=prog_last))
+    chart_prog.series[0].graphicalProperties.solidFill = TEAL
+    chart_prog.height, chart_prog.width = 6.5, 16
+    ws.add_chart(chart_prog, "E3")
+
+    chart_rev = BarChart()
+    chart_rev.type = "col"
+    chart_rev.grouping = "clustered"
+    chart_rev.title = f"Revenue vs Target ({currency})"
+    chart_rev.y_axis.numFmt = formats["money"]
+    chart_rev.add_data(Reference(ws, min_col=2, max_col=3, min_row=rev_hdr, max_row=rev_last), titles_from_data=True)
+    chart_rev.set_categories(Reference(ws, min_col=1, min_row=rev_hdr + 1, max_row=rev_last))
+    chart_rev.series[0].graphicalProperties.solidFill = TEAL
+    chart_rev.series[1].graphicalProperties.solidFill = GRAY_BORDER
+    chart_rev.height, chart_rev.width = 7.5, 16
+    ws.add_chart(chart_rev, "E17")
+
+    chart_stat = PieChart()
+    chart_stat.title = "Initiative Status"
+    chart_stat.add_data(Reference(ws, min_col=2, min_row=stat_hdr, max_row=stat_last), titles_from_data=True)
+    chart_stat.set_categories(Reference(ws, min_col=1, min_row=stat_hdr + 1, max_row=stat_last))
+    chart_stat.dataLabels = DataLabelList()
+    chart_stat.dataLabels.showVal = True
+    chart_stat.height, chart_stat.width = 7.5, 16
+    ws.add_chart(chart_stat, "E33")
 
-    (CAT_BIZ, 12, "Business & Admin", "Proposal writing and quotation preparation",
-     "KR1.1", "Khairul", "Per opportunity", "High",
-     "Each proposal needs custom scope, pricing, timeline. Use templates to speed up."),
 
-    (CAT_BIZ, 13, "Business & Admin", "Contract preparation, review, and execution",
-     "KR1.1, KR2.2", "Khairul", "Per deal", "High",
-     "Both event contracts and AI training contracts."),
+# ═══════════════════════════════════════════════════════════════
+# SHEET 7: HISTORY (KR progress over time)
+# ═══════════════════════════════════════════════════════════════
+# Each run gets an id in `runs` and appends one row per KR to an append-only
+# SQLite store; the sheet pivots KRs (rows) by the most recent runs (columns)
+# and charts the first few KRs. Runs are told apart by id, not by run_at, so
+# several exports within the same second stay separate snapshots.
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id     INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS kr_snapshots (
+    run_at   TEXT NOT NULL,
+    kr_id    TEXT NOT NULL,
+    actual   REAL,
+    target   REAL,
+    progress REAL,
+    status   TEXT,
+    run_id   INTEGER REFERENCES runs (id)
+);
+"""
+HISTORY_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_kr_snapshots_kr_run_id ON kr_snapshots (kr_id, run_id);
+"""
+HISTORY_MAX_RUNS = 52
+HISTORY_CHART_KRS = 10  # series on the line chart; more are unreadable
+HEADER_ROW7 = 3
+
+
+def open_history(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(HISTORY_SCHEMA)
+    columns = [name for _, name, *_ in conn.execute("PRAGMA table_info(kr_snapshots)")]
+    if "run_id" not in columns:
+        # Stores written before `runs` existed: one run per distinct run_at.
+        with conn:
+            conn.execute("ALTER TABLE kr_snapshots ADD COLUMN run_id INTEGER REFERENCES runs (id)")
+            conn.execute("INSERT INTO runs (run_at) SELECT DISTINCT run_at FROM kr_snapshots ORDER BY run_at")
+            conn.execute("UPDATE kr_snapshots SET run_id = "
+                         "(SELECT id FROM runs WHERE runs.run_at = kr_snapshots.run_at)")
+    conn.executescript(HISTORY_INDEXES)
+    return conn
+
+
+def record_snapshot(conn, objectives, run_at):
+    """Append the current actual/progress/status of every KR as a new run; return its id."""
+    with conn:
+        run_id = conn.execute("INSERT INTO runs (run_at) VALUES (?)", (run_at,)).lastrowid
+        conn.executemany(
+            "INSERT INTO kr_snapshots (run_at, kr_id, actual, target, progress, status, run_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(run_at, kr["id"], kr["actual"], kr["target"], kr_progress(kr), kr["status"], run_id)
+             for obj in objectives for kr in obj["krs"]],
+        )
+    return run_id
+
+
+def kr_trend(conn, kr_id, since_run=0):
+    """Return [(run_id, run_at, actual, progress, status)] for one KR, oldest first."""
+    return conn.execute(
+        "SELECT run_id, run_at, actual, progress, status FROM kr_snapshots "
+        "WHERE kr_id = ? AND run_id >= ? ORDER BY run_id",
+        (kr_id, since_run),
+    ).fetchall()
+
+
+def load_history(conn, kr_ids, max_runs=HISTORY_MAX_RUNS):
+    """Pivot the last `max_runs` runs into ([(run id, run_at)], {KR ID: {run id: progress}})."""
+    runs = conn.execute(
+        "SELECT id, run_at FROM runs ORDER BY id DESC LIMIT ?", (max_runs,)
+    ).fetchall()[::-1]
+    since_run = runs[0][0] if runs else 0
+    trends = {kr_id: {run_id: progress for run_id, _, _, progress, _ in kr_trend(conn, kr_id, since_run)}
+              for kr_id in kr_ids}
+    return runs, trends
+
+
+def layout_history(ws):
+    write_title(ws, "A1:H1", "History — KR Progress Over Time")
+    ws.column_dimensions["A"].width = 12
+    ws.freeze_panes = "B4"
+
+
+def fill_history(ws, data, ctx):
+    """Write the KR × snapshot progress pivot and a line chart over its first KRs.
+
+    KRs run down the rows and snapshots across the columns, so the width is
+    bounded by HISTORY_MAX_RUNS however many KRs there are. Uses
+    ctx["history"] from load_history(); without it the sheet holds only the
+    current KR progress.
+    """
+    runs, trends = ctx["history"] or ([(None, "Current")], {
+        kr["id"]: {None: kr_progress(kr)}
+        for obj in data["objectives"] for kr in obj["krs"]
+    })
+    kr_ids = list(trends)
+    percent = ctx["formats"]["percent"]
+    write_headers(ws, HEADER_ROW7, ["KR"] + [run_at for _, run_at in runs])
+    for col in range(2, len(runs) + 2):
+        ws.column_dimensions[get_column_letter(col)].width = 19
+
+    r = HEADER_ROW7 + 1
+    for kr_id in kr_ids:
+        style_body_cell(ws.cell(row=r, column=1, value=kr_id), font=bold_font, fill=band_fill(r))
+        for col, (run_id, _) in enumerate(runs, 2):
+            progress = trends[kr_id].get(run_id)
+            cell = ws.cell(row=r, column=col, value=None if progress is None else progress / 100)
+            style_body_cell(cell, fill=band_fill(r), align=center_align, fmt=percent)
+        r += 1
+    if not runs or not kr_ids:
+        return
+
+    charted = min(len(kr_ids), HISTORY_CHART_KRS)
+    title = "KR Progress % by Snapshot"
+    if charted < len(kr_ids):
+        title += f" (first {charted} of {len(kr_ids)} KRs)"
+    chart = LineChart()
+    chart.title = title
+    chart.y_axis.title = "Progress %"
+    chart.y_axis.scaling.min = 0
+    chart.y_axis.numFmt = percent
+    first = HEADER_ROW7 + 1
+    chart.add_data(Reference(ws, min_col=1, max_col=len(runs) + 1, min_row=first, max_row=first + charted - 1),
+                   from_rows=True, titles_from_data=True)
+    chart.set_categories(Reference(ws, min_col=2, max_col=len(runs) + 1, min_row=HEADER_ROW7))
+    chart.height, chart.width = 9, 20
+    ws.add_chart(chart, f"{get_column_letter(len(runs) + 3)}3")
 
-    (CAT_BIZ, 14, "Business & Admin", "Invoicing and payment follow-up",
-     "KR1.1, KR2.2", "Khairul", "Per project/session", "High",
-     "Revenue only counts when invoiced. Track in SAAP project financials."),
 
-    (CAT_BIZ, 15, "Business & Admin", "Financial reporting and budget tracking (SAAP)",
-     "All KRs", "Khairul", "Monthly", "High",
-     "Monthly review of revenue vs RM1M target. Events vs Training split."),
+# ═══════════════════════════════════════════════════════════════
+# SHEET 8: ISSUES (data-quality checks)
+# ═══════════════════════════════════════════════════════════════
+# validate_data() runs once per build, before any sheet is filled. Each
+# check names the columns it reads and a predicate over their values; the
+# columns are pulled out of a section once and every check on them runs as
+# a single pass over the zipped values. An issue points at the last checked
+# column's cell on the sheet that shows the row. KR references that match no
+# KR (compute_kr_links()'s dangling refs) are errors at the referring cell.
+# --strict fails the build on errors and warnings; info-level issues are
+# only reported.
+ISSUE_SEVERITIES = ("error", "warning", "info")
+ISSUE_COLORS = {"error": (RED_LIGHT, RED), "warning": (AMBER_LIGHT, AMBER), "info": (GRAY_BG, "78909C")}
+ISSUES_SHEET_LIMIT = 10000  # rows on the sheet; the JSON report has all
+STRICT_REPORT_LIMIT = 20  # issues printed when --strict fails
+HEADER_ROW8 = 3
+headers8 = ["Severity", "Sheet", "Cell", "Item", "Field", "Issue"]
+
+
+def _blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+# Section → (sheet title, headers, first data row, item ID column,
+# sheet column of a data column). "krs" is the objectives' KRs, flattened.
+ISSUE_SECTIONS = {
+    "krs": ("OKR Summary", headers1, HEADER_ROW1 + 1, "id", {"target": 5, "owner": 11}.get),
+    "kr_details": ("Key Results", headers2, HEADER_ROW2 + 1, 0, lambda col: col + 1),
+    "initiatives": ("Initiatives", headers3, HEADER_ROW3 + 1, 0, lambda col: col + 1),
+    "support_tasks": ("Support Tasks", headers5, HEADER_ROW5 + 1, 1, lambda col: col),
+}
+
+# (section, columns, predicate over the column values, severity, message)
+DATA_CHECKS = [
+    ("krs", ("target",), lambda target: not target, "error", "target is 0, so progress reads as 0%"),
+    ("krs", ("owner",), _blank, "warning", "no owner"),
+    ("kr_details", (4,), lambda target: not target, "error", "target is 0"),
+    ("kr_details", (10,), _blank, "warning", "no owner"),
+    ("initiatives", (5, 6), lambda start, end: bool(start and end and end < start),
+     "error", "ends before it starts"),
+    ("initiatives", (5,), _blank, "warning", "no start date"),
+    ("initiatives", (6,), _blank, "warning", "no end date"),
+    ("initiatives", (9,), _blank, "warning", "no person in charge"),
+    ("initiatives", (10,), _blank, "warning", "no accountable owner"),
+    ("initiatives", (7,), lambda budget: budget is None, "info", "no budget set"),
+    ("support_tasks", (5,), _blank, "warning", "no owner"),
+]
 
-    (CAT_BIZ, 16, "Business & Admin", "Client relationship management and meeting notes",
-     "KR1.1, KR1.3", "Khairul", "Ongoing", "Medium",
-     "CRM updates after every client interaction. Feed data to KR tracking."),
 
-    (CAT_BIZ, 17, "Business & Admin", "Supplier and vendor management (logistics, venues, AV)",
-     "KR1.1, KR1.2", "Khairul", "Per event", "Medium",
-     "Negotiate rates, manage relationships, ensure delivery quality."),
+def validate_data(data, links=None):
+    """Run DATA_CHECKS over the loaded sections; return issues sorted by severity.
+
+    Each issue is a dict with severity, sheet, cell, item, field and issue.
+    `links` from compute_kr_links() is reused if given.
+    """
+    rows_by_section = {
+        "krs": [kr for obj in data["objectives"] for kr in obj["krs"]],
+        "kr_details": data.get("kr_details"),
+        "initiatives": data.get("initiatives"),
+        "support_tasks": data.get("support_tasks"),
+    }
+    columns = {}
+    issues = []
+    for section, cols, predicate, severity, message in DATA_CHECKS:
+        rows = rows_by_section[section]
+        if not rows:
+            continue
+        for col in cols:
+            if (section, col) not in columns:
+                columns[section, col] = [row[col] for row in rows]
+        title, headers, first_row, id_col, sheet_col = ISSUE_SECTIONS[section]
+        col = sheet_col(cols[-1])
+        values = zip(*(columns[section, c] for c in cols))
+        for i in [i for i, args in enumerate(values) if predicate(*args)]:
+            issues.append({
+                "severity": severity,
+                "sheet": title,
+                "cell": f"{get_column_letter(col)}{first_row + i}",
+                "item": rows[i][id_col],
+                "field": headers[col - 1],
+                "issue": message,
+            })
+
+    headers_by_sheet = {title: headers for title, headers, _, _, _ in ISSUE_SECTIONS.values()}
+    for title, row, col, item_id, ref in (links or compute_kr_links(data))["dangling"]:
+        issues.append({
+            "severity": "error",
+            "sheet": title,
+            "cell": f"{get_column_letter(col)}{row}",
+            "item": item_id,
+            "field": headers_by_sheet[title][col - 1],
+            "issue": f"references unknown KR '{ref}'",
+        })
+    issues.sort(key=lambda issue: ISSUE_SEVERITIES.index(issue["severity"]))
+    return issues
+
+
+def issue_counts(issues):
+    counts = dict.fromkeys(ISSUE_SEVERITIES, 0)
+    for issue in issues:
+        counts[issue["severity"]] += 1
+    return counts
+
+
+def write_issue_report(issues, path):
+    report = {"counts": issue_counts(issues), "issues": issues}
+    write_atomic(path, json.dumps(report, indent=1, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def report_issues(issues, report_path=None, strict=False):
+    """Write the issues report if asked; under `strict`, list the blocking issues.
+
+    Returns (issue counts, whether strict mode blocks the save).
+    """
+    counts = issue_counts(issues)
+    if report_path:
+        write_issue_report(issues, report_path)
+        print(f"Issues report saved to: {report_path}")
+    blocked = strict and bool(counts["error"] or counts["warning"])
+    if blocked:
+        for issue in [i for i in issues if i["severity"] != "info"][:STRICT_REPORT_LIMIT]:
+            print(f"  {issue['severity'].upper()}: {issue['sheet']}!{issue['cell']} "
+                  f"#{issue['item']} {issue['field']}: {issue['issue']}")
+    return counts, blocked
+
+
+def layout_issues(ws):
+    write_title(ws, "A1:F1", "Data Quality Issues")
+    write_headers(ws, HEADER_ROW8, headers8)
+    set_widths(ws, [11, 16, 8, 10, 18, 45])
+    ws.freeze_panes = "A4"
+
+
+def fill_issues(ws, data, ctx):
+    """List ctx["issues"], linking each to its cell when that sheet is in the workbook."""
+    issues = ctx["issues"]
+    sheetnames = set(ws.parent.sheetnames)
+    r = HEADER_ROW8 + 1
+    for issue in issues[:ISSUES_SHEET_LIMIT]:
+        for col, key in enumerate(("severity", "sheet", "cell", "item", "field", "issue"), 1):
+            cell = ws.cell(row=r, column=col, value=issue[key])
+            style_body_cell(cell, fill=band_fill(r), align=None if col == 6 else center_align)
+        bg, fg = ISSUE_COLORS[issue["severity"]]
+        severity = ws.cell(row=r, column=1)
+        severity.fill = PatternFill(start_color=bg, end_color=bg, fill_type="solid")
+        severity.font = Font(name="Aptos", color=fg, size=10, bold=True)
+        if issue["sheet"] in sheetnames:
+            ws.cell(row=r, column=3).hyperlink = Hyperlink(
+                ref=f"C{r}", location=f"'{issue['sheet']}'!{issue['cell']}")
+        r += 1
+    if len(issues) > ISSUES_SHEET_LIMIT:
+        ws.cell(row=r, column=1, value=f"... {len(issues) - ISSUES_SHEET_LIMIT} more in the JSON report").font = body_font
 
-    (CAT_BIZ, 18, "Business & Admin", "HR — freelancer/contractor onboarding and management",
-     "KR1.2", "Khairul", "As needed", "Medium",
-     "Event PIC managers, marketing contractors. Supports initiative #12."),
 
-    (CAT_BIZ, 19, "Business & Admin", "HRDCorp application documentation and follow-up",
-     "KR2.2", "Khairul", "Until approved", "High",
-     "Supports initiative #26. Documentation-heavy process — track milestones."),
+# ═══════════════════════════════════════════════════════════════
+# WORKBOOK ASSEMBLY
+# ═══════════════════════════════════════════════════════════════
+# Sheet registry in workbook order: (title, layout, fill, data sections the
+# fill reads). `deps` lets watch mode rebuild only the sheets touched by an
+# edit, and lets `--sheets` convert only the data sections the selected
+# sheets read (the JSON file itself is still parsed whole).
+SHEETS = [
+    ("OKR Summary", layout_okr_summary, fill_okr_summary, {"objectives", "initiatives", "support_tasks"}),
+    ("Key Results", layout_key_results, fill_key_results,
+     {"objectives", "kr_details", "initiatives", "support_tasks"}),
+    ("Initiatives", layout_initiatives, fill_initiatives, {"objectives", "initiatives"}),
+    ("Structure Guide", layout_structure_guide, None, set()),
+    ("Support Tasks", layout_support_tasks, fill_support_tasks, {"objectives", "support_tasks"}),
+    ("Dashboard", layout_dashboard, fill_dashboard, {"objectives", "initiatives"}),
+    ("History", layout_history, fill_history, {"objectives"}),
+    ("Issues", layout_issues, fill_issues, {"objectives", "kr_details", "initiatives", "support_tasks"}),
+]
 
-    (CAT_BIZ, 20, "Business & Admin", "AI training session logistics (venue, equipment, catering)",
-     "KR2.1", "Khairul", "Per session", "Medium",
-     "Book venue, arrange equipment, handle logistics for each corporate session."),
 
-    (CAT_BIZ, 21, "Business & Admin", "Partnership agreement drafting and negotiation",
-     "KR1.2", "Khairul", "Per partnership", "Medium",
-     "MOU or formal partnership agreement. Legal review if needed."),
+def select_sheets(spec=None):
+    """Registry titles named in a comma-separated `spec` (case-insensitive), in workbook order.
+
+    None selects every sheet.
+    """
+    titles = [title for title, _, _, _ in SHEETS]
+    if spec is None:
+        return titles
+    by_name = {title.lower(): title for title in titles}
+    wanted = [name.strip().lower() for name in spec.split(",") if name.strip()]
+    unknown = [name for name in wanted if name not in by_name]
+    if unknown or not wanted:
+        raise ValueError(f"unknown sheets {unknown}; choose from {titles}")
+    return [title for title in titles if title.lower() in wanted]
+
+
+def sheet_sections(titles):
+    """Data sections the fills of `titles` read (objectives always: layout mode uses them)."""
+    sections = {"objectives"}
+    for title, _, _, deps in SHEETS:
+        if title in titles:
+            sections |= deps
+    return sections
+
+
+def layout_workbook(titles=None):
+    """Create a workbook holding only the static layout of each sheet (all by default)."""
+    wb = openpyxl.Workbook()
+    first = True
+    for title, layout, _, _ in SHEETS:
+        if titles is not None and title not in titles:
+            continue
+        if first:
+            ws = wb.active
+            ws.title = title
+            first = False
+        else:
+            ws = wb.create_sheet(title)
+        layout(ws)
+    return wb
+
+
+class BuildContext(dict):
+    """Shared per-build state handed to every fill function.
+
+    Entries given as factories are computed on first use, so a build that
+    selects only some sheets skips the work only other sheets need.
+    """
+
+    def __init__(self, values, factories):
+        super().__init__(values)
+        self.factories = factories
+
+    def __missing__(self, key):
+        value = self[key] = self.factories[key]()
+        return value
+
+    def dangling(self):
+        """Dangling KR links, if any fill needed the links."""
+        return self["links"]["dangling"] if "links" in self else []
+
+
+def build_context(data, history=None, layout="auto", formats=None, issues=None, links=None):
+    values = {
+        "history": history,
+        "layout_mode": resolve_layout_mode(layout, data),
+        "formats": formats or resolve_formats(),
+    }
+    if issues is not None:
+        values["issues"] = issues
+    if links is not None:
+        values["links"] = links
+    ctx = BuildContext(values, {
+        "links": lambda: compute_kr_links(data),
+        "issues": lambda: validate_data(data, ctx["links"]),
+    })
+    return ctx
+
+
+def build_workbook(data, history=None, layout="auto", formats=None, sheets=None, issues=None, links=None):
+    """Lay out and fill each selected sheet.
+
+    `history` is the (runs, trends) pivot from load_history(); `layout` is
+    one of LAYOUT_MODES; `formats` comes from resolve_formats() (default
+    en-MY, RM); `sheets` is a list of titles from select_sheets() (default
+    all). `data` only needs the sections sheet_sections() lists for them.
+    `issues` from validate_data() and `links` from compute_kr_links() are
+    reused if given.
+    Returns (workbook, dangling KR links).
+    """
+    titles = sheets or select_sheets()
+    wb = layout_workbook(titles)
+
+    ctx = build_context(data, history, layout, formats, issues, links)
+    for title, _, fill, _ in SHEETS:
+        if fill and title in titles:
+            fill(wb[title], data, ctx)
+    return wb, ctx.dangling()
+
+
+def rebuild_sheets(wb, data, titles, history=None, layout="auto", formats=None, issues=None, links=None):
+    """Re-lay-out and refill only `titles` in place; return dangling KR links."""
+    ctx = build_context(data, history, layout, formats, issues, links)
+    for title, layout_fn, fill, _ in SHEETS:
+        if title not in titles:
+            continue
+        index = wb.sheetnames.index(title)
+        wb.remove(wb[title])
+        ws = wb.create_sheet(title, index)
+        layout_fn(ws)
+        if fill:
+            fill(ws, data, ctx)
+    wb.active = 0
+    return ctx.dangling()
 
-    (CAT_BIZ, 22, "Business & Admin", "International compliance and logistics (travel, permits, banking)",
-     "KR1.1", "Khairul", "Per intl engagement", "Low",
-     "Only triggered when international work materializes. Cross-border invoicing, travel planning."),
 
-    # ── TALENTA IDEAS REQUESTS ────────────────────────────────
+# ═══════════════════════════════════════════════════════════════
+# DATA FILES
+# ═══════════════════════════════════════════════════════════════
+# A dataset file is the JSON form of SAAP_DATA: the same four lists, with
+# dates as ISO strings and support tasks without their category fill (it is
+# looked up from CATEGORY_FILLS on load). Files are written one row per line
+# from iterators, so a generated dataset never has to fit in memory.
+# `--dump-data` writes the built-in dataset in this form as a starting point
+# for editing.
+INIT_DATE_COLS = (5, 6)  # Start Date, End Date in an initiative row
+DATA_SECTIONS = ("objectives", "kr_details", "initiatives", "support_tasks")
 
-    (CAT_TALENTA, 23, "Talenta Ideas", "Design requests from Talenta Ideas (ad-hoc)",
-     "Parent company", "Azlan", "Ad-hoc", "Medium",
-     "As subsidiary, MotionVii supports Talenta's design needs. Track hours to manage capacity."),
 
-    (CAT_TALENTA, 24, "Talenta Ideas", "Video production requests from Talenta Ideas",
-     "Parent company", "Azlan", "Ad-hoc", "Medium",
-     "Corporate videos, internal comms, event coverage for Talenta's own projects."),
+def data_to_json(data):
+    """The JSON form of `data`, converted row by row as it is consumed."""
+    return {
+        "objectives": data["objectives"],
+        "kr_details": data["kr_details"],
+        "initiatives": (
+            [v.isoformat() if isinstance(v, date) else v for v in init]
+            for init in data["initiatives"]
+        ),
+        "support_tasks": (list(task[1:]) for task in data["support_tasks"]),
+    }
 
-    (CAT_TALENTA, 25, "Talenta Ideas", "Talenta Ideas brand and marketing material updates",
-     "Parent company", "Azlan", "Quarterly", "Low",
-     "Brochure updates, presentation templates, brand guideline maintenance."),
 
-    (CAT_TALENTA, 26, "Talenta Ideas", "Coordination and reporting to Talenta Ideas management",
-     "Parent company", "Khairul", "Monthly", "Medium",
-     "Monthly update on MotionVii performance, revenue, and SAAP progress to parent company."),
+def write_dataset(sections, path):
+    """Write JSON-form sections one row per line, consuming each iterator as it goes."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for i, name in enumerate(DATA_SECTIONS):
+            f.write(f'{"," if i else ""}\n{json.dumps(name)}: [')
+            sep = "\n "
+            for row in sections[name]:
+                f.write(sep + json.dumps(row, ensure_ascii=False))
+                sep = ",\n "
+            f.write("\n]")
+        f.write("\n}\n")
 
-    # ── OPERATIONS & INFRASTRUCTURE ───────────────────────────
 
-    (CAT_OPS, 27, "Operations", "SAAP platform maintenance and development",
-     "All KRs", "Khairul", "Ongoing", "Medium",
-     "The tool tracking all of this. Bug fixes, new features, data integrity."),
+def dump_data(data, path):
+    write_dataset(data_to_json(data), path)
 
-    (CAT_OPS, 28, "Operations", "Software subscriptions and tool management",
-     "All KRs", "Khairul", "Monthly", "Low",
-     "CRM, automation tools, design software, project management. Renewals and cost control."),
 
-    (CAT_OPS, 29, "Operations", "Document management and filing (contracts, proposals, invoices)",
-     "All KRs", "Khairul", "Ongoing", "Low",
-     "Keep organized for audits, HRDCorp requirements, and client records."),
+def _parse_initiatives(rows):
+    initiatives = []
+    for init in rows:
+        init = list(init)
+        for col in INIT_DATE_COLS:
+            if isinstance(init[col], str) and init[col]:
+                init[col] = date.fromisoformat(init[col])
+        initiatives.append(init)
+    return initiatives
 
-    (CAT_OPS, 30, "Operations", "Team capacity planning and workload balancing",
-     "All KRs", "Khairul", "Bi-weekly", "High",
-     "3-person team running 37 initiatives + support tasks + Talenta requests. Watch for bottlenecks on Azlan (design) and Khairul (business)."),
-]
 
-r = 5
-for task in support_tasks:
-    cat_fill = task[0]
-    data = task[1:]  # id, category, task, supports, owner, frequency, priority, notes
-
-    for col, val in enumerate(data, 1):
-        cell = ws5.cell(row=r, column=col, value=val)
-        style_body_cell(cell)
-
-        # Apply category color to row
-        cell.fill = cat_fill
-
-        if col == 1:  # ID
-            cell.alignment = center_align
-            cell.font = bold_font
-        elif col == 2:  # Category
-            cell.font = bold_font
-        elif col in (4, 5, 6, 7):  # Supports, Owner, Frequency, Priority
-            cell.alignment = center_align
-
-        # Priority color override
-        if col == 7:
-            if val == "High":
-                cell.font = Font(name="Aptos", color=RED, size=10, bold=True)
-            elif val == "Medium":
-                cell.font = Font(name="Aptos", color=AMBER, size=10, bold=True)
-            elif val == "Low":
-                cell.font = Font(name="Aptos", color="78909C", size=10)
-    r += 1
-
-ws5.column_dimensions["A"].width = 5
-ws5.column_dimensions["B"].width = 18
-ws5.column_dimensions["C"].width = 55
-ws5.column_dimensions["D"].width = 16
-ws5.column_dimensions["E"].width = 12
-ws5.column_dimensions["F"].width = 16
-ws5.column_dimensions["G"].width = 10
-ws5.column_dimensions["H"].width = 60
-ws5.freeze_panes = "A5"
-
-
-# ── Save ───────────────────────────────────────────────────────
-output_path = "/Users/khairul/Documents/MyDev/Work/Motionvii/SAAP2026v2/MotionVii_SAAP_2026_v2.xlsx"
-wb.save(output_path)
-print(f"Saved to: {output_path}")
-print(f"  Objectives: {len(objectives)}")
-print(f"  Key Results: {sum(len(o['krs']) for o in objectives)}")
-print(f"  Initiatives: {len(initiatives)}")
-print(f"  Support Tasks: {len(support_tasks)}")
+def _parse_support_tasks(rows):
+    return [(CATEGORY_FILLS.get(task[1], PatternFill()), *task) for task in rows]
+
+
+SECTION_PARSERS = {
+    "objectives": list,
+    "kr_details": list,
+    "initiatives": _parse_initiatives,
+    "support_tasks": _parse_support_tasks,
+}
+
+
+def parse_data(raw, sections=DATA_SECTIONS):
+    """Turn `sections` of a dataset in JSON form back into the SAAP_DATA form."""
+    return {name: SECTION_PARSERS[name](raw[name]) for name in DATA_SECTIONS if name in sections}
+
+
+def load_data(path, sections=DATA_SECTIONS):
+    """Read a dataset file. json.load parses the whole file; only `sections` are converted."""
+    with open(path, encoding="utf-8") as f:
+        return parse_data(json.load(f), sections)
+
+
+# ═══════════════════════════════════════════════════════════════
+# SYNTHETIC DATA (load testing)
+# ═══════════════════════════════════════════════════════════════
+# `--generate-data PATH --scale N` writes a seeded dataset N times the size
+# of the built-in one (2N objectives, 37N initiatives, 30N support tasks).
+# Each objective draws from its own Random(seed, num), so KR IDs and counts
+# can be recomputed where initiatives and support tasks reference them
+# without keeping the objectives in memory. Free text is sampled from the
+# built-in remarks and notes.
+SYNTH_AREAS = ["Events", "AI Training", "Consulting", "Digital Media", "Corporate Retreats",
+               "E-Learning", "Venue Partnerships", "Sponsorship", "Regional Expansion", "Talent Programmes"]
+SYNTH_VERBS = ["Scale", "Build", "Launch", "Grow", "Strengthen"]
+SYNTH_DEPARTMENTS = {"Business Dev": 45, "Operations": 30, "Marketing": 15, "Finance": 5, "HR": 5}
+SYNTH_OWNERS = {"Khairul": 35, "Azlan": 25, "Farah": 15, "Nadia": 10, "Hafiz": 10, "Mei Ling": 5}
+SYNTH_INIT_STATUSES = {"Pending": 50, "In Progress": 30, "Completed": 12, "On Hold": 8}
+SYNTH_KR_STATUSES = {"Not Started": 40, "On Track": 35, "At Risk": 15, "Behind": 10}
+SYNTH_RESOURCES = ["Content development", "Meetings", "Travel + registration", "Design + web",
+                   "Event manager contracts", "Delegate passes", "Software - Pipeline"]
+SYNTH_FREQUENCIES = ["Monthly", "Ongoing", "Per event", "Quarterly", "Ad-hoc", "Weekly", "Per proposal"]
+SYNTH_PRIORITIES = {"High": 40, "Medium": 45, "Low": 15}
+SYNTH_BUDGET_SHARE = 0.25  # initiatives with a budget, as in the built-in data
+SYNTH_YEAR_START = date(2026, 1, 1)
+SYNTH_YEAR_END = date(2026, 12, 31)
+
+
+def _weighted(rng, choices):
+    return rng.choices(list(choices), weights=list(choices.values()))[0]
+
+
+def _sentences():
+    text = [init[13] for init in initiatives] + [task[8] for task in support_tasks] \
+        + [row[12] for row in kr_details]
+    return [s.strip().rstrip(".") + "." for t in text for s in t.split(". ") if s.strip()]
+
+
+def _remarks(rng, sentences, empty=0.35):
+    """Empty, one sentence, or occasionally a long paragraph."""
+    if rng.random() < empty:
+        return ""
+    return " ".join(rng.sample(sentences, min(len(sentences), int(rng.paretovariate(1.5)))))
+
+
+def _objective_rng(seed, num):
+    return random.Random(f"{seed}-objective-{num}")
+
+
+def _kr_count(seed, num):
+    return _objective_rng(seed, num).randint(2, 5)
+
+
+def _synthetic_objective(seed, num, sentences):
+    """(objective dict, kr_details rows) for objective `num`."""
+    rng = _objective_rng(seed, num)
+    kr_count = rng.randint(2, 5)  # must stay the first draw, see _kr_count()
+    area = SYNTH_AREAS[(num - 1) % len(SYNTH_AREAS)]
+    short = area if num <= len(SYNTH_AREAS) else f"{area} {num}"
+    name = f"{rng.choice(SYNTH_VERBS)} {short} Business"
+    krs, details = [], []
+    for j in range(1, kr_count + 1):
+        if j == 1 or rng.random() < 0.15:
+            metric, unit = "Revenue", "RM"
+            target = rng.randrange(50_000, 1_000_001, 10_000)
+        else:
+            metric, unit = "Count", rng.choice(["paid sessions", "active partnerships", "repeat/referred clients"])
+            target = rng.randint(2, 30)
+        status = _weighted(rng, SYNTH_KR_STATUSES)
+        actual = 0 if status == "Not Started" else round(target * rng.uniform(0.05, 0.9))
+        deadline = f"Q{rng.randint(2, 4)} 2026"
+        owner = _weighted(rng, SYNTH_OWNERS)
+        if unit == "RM":
+            desc = f"Generate RM{target:,} in {short} revenue by {deadline}"
+        else:
+            desc = f"Reach {target} {unit} in {short} by {deadline}"
+        kr = {"id": f"KR{num}.{j}", "desc": desc, "target": target, "actual": actual, "unit": unit,
+              "deadline": deadline, "status": status, "owner": owner}
+        krs.append(kr)
+        details.append([kr["id"], short, desc, metric, target, actual, unit,
+                        f"{round(actual / target * 100)}%", deadline, status, owner,
+                        _remarks(rng, sentences, empty=0), _remarks(rng, sentences)])
+    return {"num": num, "name": name, "krs": krs}, details, short
+
+
+def synthetic_data(seed=0, scale=1):
+    """Seeded synthetic dataset in JSON form; every section is a lazy iterator."""
+    n_objectives, n_initiatives, n_tasks = 2 * scale, 37 * scale, 30 * scale
+    sentences = _sentences()
+
+    def objective_rows():
+        for num in range(1, n_objectives + 1):
+            yield _synthetic_objective(seed, num, sentences)[0]
+
+    def kr_detail_rows():
+        for num in range(1, n_objectives + 1):
+            yield from _synthetic_objective(seed, num, sentences)[1]
+
+    def initiative_rows():
+        # Contiguous blocks per objective, ordered by KR within each block.
+        rng = random.Random(f"{seed}-initiatives")
+        item_id = 0
+        for num in range(1, n_objectives + 1):
+            short = _synthetic_objective(seed, num, sentences)[2]
+            kr_count = _kr_count(seed, num)
+            block = (num * n_initiatives // n_objectives) - ((num - 1) * n_initiatives // n_objectives)
+            for pos in range(block):
+                item_id += 1
+                start = SYNTH_YEAR_START + timedelta(days=rng.randint(0, 300))
+                end = min(start + timedelta(days=rng.randint(14, 270)), SYNTH_YEAR_END)
+                has_budget = rng.random() < SYNTH_BUDGET_SHARE
+                budget = round(rng.lognormvariate(8.5, 1.0), -2) if has_budget else None
+                status = _weighted(rng, SYNTH_INIT_STATUSES)
+                progress = {"Pending": "", "Completed": "100%"}.get(status, f"{rng.randrange(10, 100, 10)}%")
+                yield [
+                    item_id, f"KR{num}.{pos * kr_count // block + 1}", short,
+                    rng.choice(sentences).rstrip("."), _weighted(rng, SYNTH_DEPARTMENTS),
+                    start.isoformat(), end.isoformat(), int(budget) if budget else None,
+                    rng.choice(SYNTH_RESOURCES) if has_budget else None,
+                    _weighted(rng, SYNTH_OWNERS), _weighted(rng, SYNTH_OWNERS),
+                    status, progress, _remarks(rng, sentences),
+                ]
+
+    def support_task_rows():
+        rng = random.Random(f"{seed}-support-tasks")
+        categories = list(CATEGORY_FILLS)
+        for item_id in range(1, n_tasks + 1):
+            roll = rng.random()
+            if roll < 0.15:
+                supports = ALL_KRS
+            elif roll < 0.25:
+                supports = "Parent company"
+            else:
+                refs = set()
+                for _ in range(1 if roll < 0.85 else 2):
+                    num = rng.randint(1, n_objectives)
+                    refs.add(f"KR{num}.{rng.randint(1, _kr_count(seed, num))}")
+                supports = ", ".join(sorted(refs))
+            yield [
+                item_id, rng.choice(categories), rng.choice(sentences).rstrip("."), supports,
+                _weighted(rng, SYNTH_OWNERS), rng.choice(SYNTH_FREQUENCIES),
+                _weighted(rng, SYNTH_PRIORITIES), _remarks(rng, sentences),
+            ]
+
+    return {
+        "objectives": objective_rows(),
+        "kr_details": kr_detail_rows(),
+        "initiatives": initiative_rows(),
+        "support_tasks": support_task_rows(),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# OUTPUT
+# ═══════════════════════════════════════════════════════════════
+# The package is written through our own ZipFile rather than wb.save(), so
+# the compression method/level and the destination (path or any binary file
+# object, including unseekable streams like stdout) are chosen per run.
+#
+# Deterministic mode pins every source of run-to-run variation in the .xlsx:
+# document created/modified times and zip entry timestamps/attributes. Part
+# order and style indexes already follow build order, which is fixed, so
+# identical data gives identical bytes and the SHA-256 works as a cache key.
+FIXED_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+# name → (zip method, zlib level); "store" is fastest, "max" is smallest
+COMPRESSION_LEVELS = {
+    "store": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, None),
+    "max": (zipfile.ZIP_DEFLATED, 9),
+}
+
+
+def fixed_timestamp():
+    """SOURCE_DATE_EPOCH when set (reproducible-builds convention), else 1 Jan 2026."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), tz=timezone.utc).replace(tzinfo=None)
+    return datetime(2026, 1, 1)
+
+
+class PackageZip(zipfile.ZipFile):
+    """Write-only ZipFile that gives every part fixed metadata when deterministic."""
+
+    def __init__(self, file, compression="default", deterministic=False):
+        method, level = COMPRESSION_LEVELS[compression]
+        super().__init__(file, "w", method, allowZip64=True, compresslevel=level)
+        self.deterministic = deterministic
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if self.deterministic and isinstance(zinfo_or_arcname, str):
+            zinfo_or_arcname = zipfile.ZipInfo(zinfo_or_arcname, date_time=FIXED_ZIP_DATE)
+            zinfo_or_arcname.compress_type = self.compression
+            zinfo_or_arcname.create_system = 3
+            zinfo_or_arcname.external_attr = 0o644 << 16
+            compresslevel = self.compresslevel
+        super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        # openpyxl adds worksheets from temp files, whose mtime would leak in.
+        if not self.deterministic:
+            return super().write(filename, arcname, compress_type, compresslevel)
+        with open(filename, "rb") as f:
+            self.writestr(arcname or os.path.basename(filename), f.read())
+
+
+def write_package(wb, file, compression="default", deterministic=False):
+    """Write the workbook as .xlsx to a path or binary file object.
+
+    Returns the zip entries (ZipInfo) so callers can report part sizes.
+    """
+    if deterministic:
+        wb.properties.created = wb.properties.modified = fixed_timestamp()
+    else:
+        wb.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    archive = PackageZip(file, compression, deterministic)
+    ExcelWriter(wb, archive).save()
+    return archive.infolist()
+
+
+def workbook_bytes(wb, compression="default", deterministic=False):
+    """Serialise the workbook to .xlsx bytes; return (bytes, zip entries)."""
+    buf = io.BytesIO()
+    parts = write_package(wb, buf, compression, deterministic)
+    return buf.getvalue(), parts
+
+
+def print_part_sizes(parts):
+    """Per-part compressed vs uncompressed size table."""
+    width = max(len(p.filename) for p in parts)
+    print(f"  {'Part':<{width}}  {'Size':>10}  {'Compressed':>10}  Ratio")
+    for p in parts:
+        ratio = p.compress_size / p.file_size if p.file_size else 1
+        print(f"  {p.filename:<{width}}  {p.file_size:>10,}  {p.compress_size:>10,}  {ratio:5.0%}")
+    total = sum(p.file_size for p in parts)
+    packed = sum(p.compress_size for p in parts)
+    print(f"  {'Total':<{width}}  {total:>10,}  {packed:>10,}  {packed / total if total else 1:5.0%}")
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def write_atomic(path, payload):
+    """Write via a temp file in the same directory and rename it into place,
+    so a reader that has the file open never sees a half-written workbook."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix=".saap-", suffix=".xlsx.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def save_output(wb, output, deterministic=False, compression="default", report_sizes=False):
+    """Write the workbook to `output` and print where it went.
+
+    `output` is a path (written atomically; in deterministic mode skipped when
+    the existing file has the same hash) or a binary stream written directly.
+    """
+    if not isinstance(output, str):
+        parts = write_package(wb, output, compression, deterministic)
+        output.flush()
+        print("Written to stream")
+    else:
+        payload, parts = workbook_bytes(wb, compression, deterministic)
+        digest = hashlib.sha256(payload).hexdigest()
+        if deterministic and os.path.exists(output) and file_sha256(output) == digest:
+            print(f"Unchanged: {output}")
+        else:
+            write_atomic(output, payload)
+            print(f"Saved to: {output}")
+        if deterministic:
+            print(f"  SHA-256: {digest}")
+    if report_sizes:
+        print_part_sizes(parts)
+
+
+# ═══════════════════════════════════════════════════════════════
+# WATCH MODE
+# ═══════════════════════════════════════════════════════════════
+# Keeps the process (imports, workbook) warm between edits. File events come
+# from watchdog (inotify on Linux, FSEvents on macOS) when it is installed,
+# otherwise from mtime polling. A burst of saves is debounced into one
+# rebuild, and only sheets whose data sections changed are rebuilt.
+WATCH_DEBOUNCE = 0.5
+WATCH_POLL_INTERVAL = 0.25
+WATCH_EVENT_TYPES = {"created", "modified", "moved", "deleted"}
+
+
+class ChangeWatcher:
+    """Signals when any of `paths` is created, modified, replaced or deleted."""
+
+    def __init__(self, paths):
+        self.paths = {os.path.abspath(p) for p in paths}
+        self.last_event = None
+        self.observer = None
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            self.mtimes = self._mtimes()
+            return
+
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            # Only content and path changes: reading the file in watch() itself
+            # raises "opened" / "closed_no_write" events on inotify.
+            def on_any_event(self, event):
+                if event.event_type not in WATCH_EVENT_TYPES:
+                    return
+                touched = {os.path.abspath(event.src_path),
+                           os.path.abspath(getattr(event, "dest_path", "") or event.src_path)}
+                if touched & watcher.paths:
+                    watcher.last_event = time.monotonic()
+
+        # Watch parent directories: editors often save by writing a new file
+        # and renaming it over the old one, which drops a per-file watch.
+        self.observer = Observer()
+        for directory in {os.path.dirname(p) for p in self.paths}:
+            self.observer.schedule(Handler(), directory, recursive=False)
+        self.observer.start()
+
+    def _mtimes(self):
+        return {p: os.stat(p).st_mtime_ns if os.path.exists(p) else None for p in self.paths}
+
+    def wait(self, debounce=WATCH_DEBOUNCE):
+        """Block until a change is seen and no further change for `debounce` seconds."""
+        while True:
+            if self.observer is None:
+                mtimes = self._mtimes()
+                if mtimes != self.mtimes:
+                    self.mtimes = mtimes
+                    self.last_event = time.monotonic()
+            if self.last_event is not None and time.monotonic() - self.last_event >= debounce:
+                self.last_event = None
+                return
+            time.sleep(WATCH_POLL_INTERVAL)
+
+    def close(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+
+
+def affected_sheets(old_data, new_data):
+    """Titles of sheets whose fill reads a data section that changed."""
+    changed = {key for key in new_data if old_data.get(key) != new_data[key]}
+    return [title for title, _, fill, deps in SHEETS if fill and deps & changed]
+
+
+def watch(args, wb, data, history):
+    """Rebuild and re-save the workbook each time the data file settles after an edit.
+
+    Each rebuild re-validates the data and rewrites --issues-report; under
+    --strict, an edit with errors or warnings is reported but not saved.
+    """
+    watcher = ChangeWatcher([args.data])
+    print(f"Watching {args.data} (Ctrl+C to stop)")
+    try:
+        while True:
+            watcher.wait()
+            try:
+                new_data = load_data(args.data, sheet_sections(args.sheets))
+            except (OSError, ValueError, KeyError, IndexError) as e:
+                print(f"Skipped rebuild, data file not loadable: {e!r}")
+                continue
+            started = time.perf_counter()
+            links = compute_kr_links(new_data)
+            issues = validate_data(new_data, links)
+            counts, blocked = report_issues(issues, args.issues_report, args.strict)
+            if blocked:
+                # Keep `data` at what the saved workbook shows, so the next
+                # edit is diffed against it.
+                print(f"Skipped save, strict mode: {counts['error']} errors, "
+                      f"{counts['warning']} warnings in the data")
+                continue
+            titles = [title for title in affected_sheets(data, new_data) if title in args.sheets]
+            if not titles:
+                print("No data changes")
+                continue
+            dangling_links = rebuild_sheets(wb, new_data, titles, history, args.layout, args.formats,
+                                            issues, links)
+            save_output(wb, args.output, args.deterministic, args.compression, args.report_sizes)
+            data = new_data
+            print(f"  Rebuilt {', '.join(titles)} in {time.perf_counter() - started:.2f}s"
+                  f" ({len(dangling_links)} dangling KR links)")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the SAAP 2026 Excel workbook.")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="output .xlsx path, or - for stdout")
+    parser.add_argument("--compression", choices=list(COMPRESSION_LEVELS), default="default",
+                        help="zip compression: store (fastest write), fast, default, max (smallest file)")
+    parser.add_argument("--report-sizes", action="store_true",
+                        help="print compressed vs uncompressed size per package part")
+    parser.add_argument("--history-db", metavar="PATH",
+                        help="SQLite snapshot store (default: saap_history.sqlite next to the output); "
+                             "used only when the History sheet is built")
+    parser.add_argument("--no-history", action="store_true",
+                        help="don't record a snapshot or read history for this run")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="byte-reproducible output (fixed zip/document metadata); implies --no-history "
+                             "and skips the write when the output is unchanged")
+    parser.add_argument("--layout", choices=LAYOUT_MODES, default="auto",
+                        help="objective rows: merged cells, collapsible outline groups, or auto "
+                             f"(groups above {AUTO_GROUP_THRESHOLD} objectives)")
+    parser.add_argument("--locale", choices=list(LOCALES), default="en-MY",
+                        help="date format and month-name language")
+    parser.add_argument("--currency", choices=list(CURRENCIES), default="RM",
+                        help="currency for amounts (data is in RM; others need --fx-rate)")
+    parser.add_argument("--fx-rate", type=float, metavar="RM",
+                        help="ringgit per unit of --currency, e.g. 4.45 for USD")
+    parser.add_argument("--data", metavar="PATH", help="JSON dataset file instead of the built-in data")
+    parser.add_argument("--dump-data", metavar="PATH", help="write the built-in dataset as JSON and exit")
+    parser.add_argument("--generate-data", metavar="PATH",
+                        help="write a seeded synthetic dataset as JSON and exit (see --scale, --seed)")
+    parser.add_argument("--scale", type=int, default=1,
+                        help="synthetic dataset size as a multiple of the built-in one (default 1)")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic dataset seed (default 0)")
+    parser.add_argument("--watch", action="store_true",
+                        help="stay running and regenerate when the --data file changes "
+                             "(regenerations don't record history snapshots)")
+    parser.add_argument("--sheets", metavar="TITLES",
+                        help="comma-separated sheet titles to build, e.g. 'Support Tasks' (default: all); "
+                             "only the data sections those sheets read are converted")
+    parser.add_argument("--issues-report", metavar="PATH", help="write the data-quality issues as JSON")
+    parser.add_argument("--strict", action="store_true",
+                        help="fail without writing the workbook if the data has error or warning issues")
+    args = parser.parse_args(argv)
+    try:
+        args.sheets = select_sheets(args.sheets)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        args.formats = resolve_formats(args.locale, args.currency, args.fx_rate)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
+    if args.watch and not args.data:
+        parser.error("--watch needs --data (create one with --dump-data)")
+    if args.watch and args.output == "-":
+        parser.error("--watch needs a file --output")
+
+    if args.output == "-":
+        # The workbook goes to stdout, so status output moves to stderr.
+        stream = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr):
+            run(args, stream)
+    else:
+        run(args, args.output)
+
+
+def run(args, output):
+    if args.dump_data:
+        dump_data(SAAP_DATA, args.dump_data)
+        print(f"Dataset saved to: {args.dump_data}")
+        return
+
+    if args.generate_data:
+        write_dataset(synthetic_data(args.seed, args.scale), args.generate_data)
+        print(f"Synthetic dataset (seed {args.seed}, scale {args.scale}) saved to: {args.generate_data}")
+        return
+
+    if args.data:
+        data = load_data(args.data, sheet_sections(args.sheets))
+    else:
+        data = SAAP_DATA
+
+    links = compute_kr_links(data)
+    issues = validate_data(data, links)
+    counts, blocked = report_issues(issues, args.issues_report, args.strict)
+    if blocked:
+        raise SystemExit(f"Strict mode: {counts['error']} errors, {counts['warning']} warnings in the data")
+
+    history = None
+    if "History" in args.sheets and not (args.no_history or args.deterministic):
+        history_db = args.history_db or os.path.join(
+            os.path.dirname(os.path.abspath(args.output)), "saap_history.sqlite")
+        conn = open_history(history_db)
+        try:
+            record_snapshot(conn, data["objectives"], datetime.now().isoformat(sep=" ", timespec="seconds"))
+            kr_ids = [kr["id"] for obj in data["objectives"] for kr in obj["krs"]]
+            history = load_history(conn, kr_ids)
+        finally:
+            conn.close()
+
+    wb, dangling_links = build_workbook(data, history=history,
+                                        layout=args.layout, formats=args.formats, sheets=args.sheets,
+                                        issues=issues, links=links)
+
+    # ── Save ───────────────────────────────────────────────────
+    save_output(wb, output, args.deterministic, args.compression, args.report_sizes)
+    print(f"  Objectives: {len(data['objectives'])}")
+    print(f"  Key Results: {sum(len(o['krs']) for o in data['objectives'])}")
+    if "initiatives" in data:
+        print(f"  Initiatives: {len(data['initiatives'])}")
+    if "support_tasks" in data:
+        print(f"  Support Tasks: {len(data['support_tasks'])}")
+    print(f"  Dangling KR links: {len(dangling_links)}")
+    print(f"  Issues: {counts['error']} errors, {counts['warning']} warnings, {counts['info']} info")
+    if history:
+        print(f"  History snapshots: {len(history[0])}")
+
+    if args.watch:
+        watch(args, wb, data, history)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Helpers shared by the golden and invariant tests."""
+import io
+import json
+from datetime import date, datetime
+
+import openpyxl
+
+import generate_saap_excel as saap
+
+
+def _dump_value(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def normalise_workbook(wb):
+    """JSON-ready dump of what a reader sees, taken from the saved package."""
+    package, _ = saap.workbook_bytes(wb, "default", deterministic=True)
+    saved = openpyxl.load_workbook(io.BytesIO(package))
+    dump = {}
+    for ws in saved.worksheets:
+        cells = {}
+        for row in ws.iter_rows():
+            for c in row:
+                if c.value is None and not c.has_style:
+                    continue
+                cells[c.coordinate] = [
+                    _dump_value(c.value), c.number_format,
+                    c.font.name, c.font.b, c.font.sz, c.font.color.rgb if c.font.color else None,
+                    c.fill.fgColor.rgb if c.fill.fill_type else None,
+                    c.alignment.horizontal, c.alignment.vertical, c.alignment.wrap_text,
+                    [side.style if side else None
+                     for side in (c.border.left, c.border.right, c.border.top, c.border.bottom)],
+                ]
+        dump[ws.title] = {
+            "cells": cells,
+            "merges": sorted(str(m) for m in ws.merged_cells.ranges),
+            "widths": {k: d.width for k, d in ws.column_dimensions.items()},
+            "heights": {str(k): d.height for k, d in ws.row_dimensions.items() if d.height},
+            "outline": {str(k): d.outlineLevel for k, d in ws.row_dimensions.items() if d.outlineLevel},
+            "freeze": ws.freeze_panes,
+            "charts": [chart.tagname for chart in ws._charts],
+        }
+    return json.loads(json.dumps(dump, default=str))
+
+
+def format_dump(dump):
+    """Serialise a normalise_workbook() dump with one line per cell, for reviewable diffs."""
+    def line(value):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+    lines = ["{"]
+    for i, (title, sheet) in enumerate(sorted(dump.items())):
+        lines.append(f" {line(title)}: {{")
+        lines.append('  "cells": {')
+        cells = sorted(sheet["cells"].items())
+        lines.extend(f"   {line(coord)}: {line(cell)}{',' if j < len(cells) - 1 else ''}"
+                     for j, (coord, cell) in enumerate(cells))
+        lines.append("  },")
+        rest = sorted((key, value) for key, value in sheet.items() if key != "cells")
+        lines.extend(f"  {line(key)}: {line(value)}{',' if j < len(rest) - 1 else ''}"
+                     for j, (key, value) in enumerate(rest))
+        lines.append(" }" + ("," if i < len(dump) - 1 else ""))
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def diff_dumps(expected, actual, path=""):
+    """Yield 'path: expected -> actual' for every difference."""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(set(expected) | set(actual), key=str):
+            if key not in actual:
+                yield f"{path}/{key}: missing"
+            elif key not in expected:
+                yield f"{path}/{key}: unexpected {repr(actual[key])[:80]}"
+            else:
+                yield from diff_dumps(expected[key], actual[key], f"{path}/{key}")
+    elif expected != actual:
+        yield f"{path}: {expected!r} -> {actual!r}"
+
+
+def scale_data(data, copies):
+    """`copies` renumbered copies of `data`, with KR references remapped per copy."""
+    objectives, kr_details, initiatives, support_tasks = [], [], [], []
+    per_copy = max(obj["num"] for obj in data["objectives"])
+    for k in range(copies):
+        kr_map = {}
+        for obj in data["objectives"]:
+            num = obj["num"] + k * per_copy
+            krs = []
+            for j, kr in enumerate(obj["krs"], 1):
+                kr_map[kr["id"]] = f"KR{num}.{j}"
+                krs.append(dict(kr, id=kr_map[kr["id"]]))
+            objectives.append(dict(obj, num=num, krs=krs))
+
+        def remap(ref):
+            if not k:
+                return ref
+            return ", ".join(kr_map.get(t.strip(), t.strip()) for t in ref.split(","))
+
+        for row in data["kr_details"]:
+            kr_details.append([kr_map.get(row[0], row[0])] + list(row[1:]))
+        for init in data["initiatives"]:
+            initiatives.append([len(initiatives) + 1, remap(init[1])] + list(init[2:]))
+        for task in data["support_tasks"]:
+            support_tasks.append((task[0], len(support_tasks) + 1, task[2], task[3], remap(task[4])) + tuple(task[5:]))
+    return {"objectives": objectives, "kr_details": kr_details,
+            "initiatives": initiatives, "support_tasks": support_tasks}
+
+
+def synthetic(seed, scale):
+    """Parsed synthetic dataset, as --generate-data followed by --data would load it."""
+    sections = saap.synthetic_data(seed, scale)
+    return saap.parse_data({name: list(rows) for name, rows in sections.items()})
+
+
+def check_invariants(wb, data, layout_mode):
+    """Return a list of invariant violations for a workbook built from `data`."""
+    problems = []
+    if wb.sheetnames != [title for title, _, _, _ in saap.SHEETS]:
+        problems.append(f"sheet order {wb.sheetnames}")
+        return problems
+
+    kr_count = sum(len(obj["krs"]) for obj in data["objectives"])
+    tables = [
+        ("OKR Summary", saap.HEADER_ROW1, saap.headers1 + saap.BACKREF_HEADERS, kr_count),
+        ("Key Results", saap.HEADER_ROW2, saap.headers2 + saap.BACKREF_HEADERS, len(data["kr_details"])),
+        ("Initiatives", saap.HEADER_ROW3, saap.headers3, len(data["initiatives"])),
+        ("Support Tasks", saap.HEADER_ROW5, saap.headers5, len(data["support_tasks"])),
+    ]
+    for title, header_row, headers, rows in tables:
+        ws = wb[title]
+        labels = [ws.cell(row=header_row, column=col).value for col in range(1, len(headers) + 1)]
+        if labels != headers:
+            problems.append(f"{title}: header row {header_row} is {labels}")
+        if not all(ws.cell(row=header_row, column=col).fill.fgColor.rgb.endswith(saap.TEAL)
+                   for col in range(1, len(headers) + 1)):
+            problems.append(f"{title}: header row {header_row} not styled")
+        if ws.max_row != header_row + rows:
+            problems.append(f"{title}: {ws.max_row - header_row} data rows, expected {rows}")
+        for r in range(header_row + 1, header_row + rows + 1):
+            cell = ws.cell(row=r, column=len(headers))
+            if cell.border.left.style != "thin" or cell.font.name != "Aptos":
+                problems.append(f"{title}!{cell.coordinate}: body style missing")
+                break
+            if title != "Support Tasks" and (cell.fill.fill_type == "solid") != (r % 2 == 0):
+                problems.append(f"{title}!{cell.coordinate}: banding broken")
+                break
+
+    ws = wb["OKR Summary"]
+    multi_kr = [obj for obj in data["objectives"] if len(obj["krs"]) > 1]
+    merges = sum(1 for m in ws.merged_cells.ranges if m.min_row > saap.HEADER_ROW1)
+    grouped = sum(1 for d in ws.row_dimensions.values() if d.outlineLevel)
+    if layout_mode == "merge" and (merges, grouped) != (2 * len(multi_kr), 0):
+        problems.append(f"OKR Summary: {merges} merges / {grouped} grouped rows in merge mode")
+    if layout_mode == "group" and (merges, grouped) != (0, sum(len(o["krs"]) - 1 for o in multi_kr)):
+        problems.append(f"OKR Summary: {merges} merges / {grouped} grouped rows in group mode")
+
+    links = saap.compute_kr_links(data)
+    first_row = saap.HEADER_ROW1 + 1
+    for offset, key in enumerate(("initiatives", "support_tasks")):
+        col = len(saap.headers1) + 1 + offset
+        total = sum(ws.cell(row=r, column=col).value or 0 for r in range(first_row, first_row + kr_count))
+        if total != sum(links[key].values()):
+            problems.append(f"OKR Summary: {key} back-references sum to {total}")
+    return problems
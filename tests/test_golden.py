@@ -0,0 +1,31 @@
+"""The built-in dataset must render exactly as the committed golden dump.
+
+After an intended layout change, regenerate the dump with
+SAAP_UPDATE_GOLDEN=1 python -m pytest tests/test_golden.py and review its diff.
+"""
+import json
+import os
+
+import generate_saap_excel as saap
+from saap_checks import diff_dumps, format_dump, normalise_workbook
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden", "saap_default.json")
+DIFF_LIMIT = 20
+
+
+def test_builtin_dataset_matches_golden():
+    wb, _ = saap.build_workbook(saap.SAAP_DATA)
+    dump = normalise_workbook(wb)
+    if os.environ.get("SAAP_UPDATE_GOLDEN"):
+        with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+            f.write(format_dump(dump))
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        golden = json.load(f)
+    diffs = list(diff_dumps(golden, dump))
+    assert not diffs, f"{len(diffs)} differences:\n" + "\n".join(diffs[:DIFF_LIMIT])
+
+
+def test_golden_build_is_deterministic():
+    first, _ = saap.workbook_bytes(saap.build_workbook(saap.SAAP_DATA)[0], deterministic=True)
+    second, _ = saap.workbook_bytes(saap.build_workbook(saap.SAAP_DATA)[0], deterministic=True)
+    assert first == second
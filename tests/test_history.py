@@ -0,0 +1,24 @@
+"""The SQLite snapshot store behind the History sheet."""
+import generate_saap_excel as saap
+
+
+def test_runs_in_the_same_second_stay_separate(tmp_path):
+    conn = saap.open_history(str(tmp_path / "history.sqlite"))
+    objectives = saap.SAAP_DATA["objectives"]
+    first = saap.record_snapshot(conn, objectives, "2026-10-19 09:00:00")
+    second = saap.record_snapshot(conn, objectives, "2026-10-19 09:00:00")
+    kr_ids = [kr["id"] for obj in objectives for kr in obj["krs"]]
+    runs, trends = saap.load_history(conn, kr_ids)
+    conn.close()
+
+    assert runs == [(first, "2026-10-19 09:00:00"), (second, "2026-10-19 09:00:00")]
+    assert all(set(trend) == {first, second} for trend in trends.values())
+
+
+def test_history_keeps_the_last_max_runs(tmp_path):
+    conn = saap.open_history(str(tmp_path / "history.sqlite"))
+    for day in range(1, 6):
+        saap.record_snapshot(conn, saap.SAAP_DATA["objectives"], f"2026-10-0{day}")
+    runs, _ = saap.load_history(conn, ["KR1.1"], max_runs=3)
+    conn.close()
+    assert [run_at for _, run_at in runs] == ["2026-10-03", "2026-10-04", "2026-10-05"]
@@ -0,0 +1,40 @@
+"""Layout invariants that must hold at any dataset size, in every layout mode."""
+import pytest
+
+import generate_saap_excel as saap
+from saap_checks import check_invariants, scale_data, synthetic
+
+SCALES = (1, 5, 30)  # 30 copies crosses AUTO_GROUP_THRESHOLD
+SYNTHETIC = [(seed, scale) for seed in (1, 2, 3) for scale in (1, 8)] + [(4, 40)]
+
+
+def assert_invariants(data, layout):
+    wb, _ = saap.build_workbook(data, layout=layout)
+    saap.workbook_bytes(wb, "store", deterministic=True)
+    problems = check_invariants(wb, data, saap.resolve_layout_mode(layout, data))
+    assert not problems, "\n".join(problems)
+
+
+@pytest.mark.parametrize("layout", saap.LAYOUT_MODES)
+@pytest.mark.parametrize("copies", SCALES)
+def test_scaled_builtin_dataset(copies, layout):
+    assert_invariants(scale_data(saap.SAAP_DATA, copies), layout)
+
+
+@pytest.mark.parametrize("layout", saap.LAYOUT_MODES)
+@pytest.mark.parametrize("seed,scale", SYNTHETIC)
+def test_synthetic_dataset(seed, scale, layout):
+    assert_invariants(synthetic(seed, scale), layout)
+
+
+@pytest.mark.parametrize("seed", (1, 2, 3))
+def test_synthetic_dataset_is_seeded(seed):
+    assert synthetic(seed, 2) == synthetic(seed, 2)
+    assert synthetic(seed, 2) != synthetic(seed + 10, 2)
+
+
+@pytest.mark.parametrize("seed,scale", [(1, 1), (2, 3)])
+def test_synthetic_dataset_round_trips(tmp_path, seed, scale):
+    path = tmp_path / "data.json"
+    saap.write_dataset(saap.synthetic_data(seed, scale), str(path))
+    assert saap.load_data(str(path)) == synthetic(seed, scale)
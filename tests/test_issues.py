@@ -0,0 +1,44 @@
+"""Data-quality issues reported on the Issues sheet and by --strict."""
+import copy
+import json
+
+import pytest
+
+import generate_saap_excel as saap
+
+
+def test_builtin_dataset_has_no_blocking_issues():
+    counts = saap.issue_counts(saap.validate_data(saap.SAAP_DATA))
+    assert (counts["error"], counts["warning"]) == (0, 0)
+
+
+def test_dangling_kr_reference_is_an_error(tmp_path):
+    data = copy.deepcopy(saap.SAAP_DATA)
+    data["initiatives"][0][1] = "KR9.9"
+    issues = saap.validate_data(data)
+    assert issues[0] == {
+        "severity": "error", "sheet": "Initiatives", "cell": f"B{saap.HEADER_ROW3 + 1}",
+        "item": data["initiatives"][0][0], "field": "KR", "issue": "references unknown KR 'KR9.9'",
+    }
+
+    wb, _ = saap.build_workbook(data)
+    ws = wb["Issues"]
+    assert ws.cell(row=saap.HEADER_ROW8 + 1, column=6).value == "references unknown KR 'KR9.9'"
+
+    path = tmp_path / "data.json"
+    saap.dump_data(data, str(path))
+    with pytest.raises(SystemExit, match="Strict mode: 1 errors"):
+        saap.main(["--data", str(path), "--strict", "-o", str(tmp_path / "out.xlsx")])
+    assert not (tmp_path / "out.xlsx").exists()
+
+
+def test_report_issues_blocks_only_in_strict_mode(tmp_path):
+    data = copy.deepcopy(saap.SAAP_DATA)
+    data["initiatives"][0][9] = ""
+    issues = saap.validate_data(data)
+    path = tmp_path / "issues.json"
+
+    counts, blocked = saap.report_issues(issues, str(path))
+    assert counts["warning"] == 1 and not blocked
+    assert json.loads(path.read_text(encoding="utf-8"))["counts"] == counts
+    assert saap.report_issues(issues, strict=True) == (counts, True)